@@ -1,5 +1,4 @@
 # Command-line interface (UI) elements
-from .spell_checker import SpellChecker
 from prompt_toolkit import PromptSession, print_formatted_text
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.formatted_text import HTML
@@ -340,9 +339,15 @@ class SlashCompleter(Completer):
                 # Yield completion
                 yield Completion(word, start_position=-(len(current_word) + 1))
 
+# Reused across "Track Object" prompts (created lazily, on first use)
+_tracking_session = None
+
 def get_tracking_target():
     """Prompts the user for an object to track."""
-    session = PromptSession()
+    global _tracking_session
+    if _tracking_session is None:
+        _tracking_session = PromptSession()
+    session = _tracking_session
     try:
         print("Enter object class to track (e.g. 'bottle', 'person'). Leave empty to stop.")
         target = session.prompt("Track Object: ")
@@ -456,7 +461,9 @@ def pepper_talk_session(robot_client, config, verbose=False):
     print(" --- Entering PepperTalk --- (type /help for options, /q to exit)")
 
     # Initialize spell checker
+    # Imported here: transformers/torch take seconds to load and only Talk mode needs them
     try:
+        from .spell_checker import SpellChecker
         spell_checker = SpellChecker()
         print("Spell Checker Initialized.")
     except Exception as e:
@@ -517,12 +524,12 @@ def pepper_talk_session(robot_client, config, verbose=False):
             message_to_speak = get_verified_text(session, spell_checker, message_part, tag=animation_tag)
 
             if message_to_speak:
-                robot_client.animated_talk(animation_tag, message_to_speak)
+                robot_client.animated_talk_async(animation_tag, message_to_speak)
                 # Feedback to user
                 print_formatted_text(HTML(f"<ansiyellow>[Pepper] Said:</ansiyellow> \"{message_to_speak} [{animation_tag}]\""))
             elif message_part == "" and not message_to_speak:
                  # Just animation
-                 robot_client.play_animation_blocking(animation_tag)
+                 robot_client.play_animation_async(animation_tag)
                  print_formatted_text(HTML(f"<ansiyellow>[Pepper] Said:</ansiyellow> \"[{animation_tag}]\""))
             
             found_emoticon = True
@@ -545,10 +552,10 @@ def pepper_talk_session(robot_client, config, verbose=False):
                  message_to_speak = get_verified_text(session, spell_checker, message_part, tag=animation_tag)
 
                  if message_to_speak:
-                    robot_client.animated_talk(animation_tag, message_to_speak)
+                    robot_client.animated_talk_async(animation_tag, message_to_speak)
                     print_formatted_text(HTML(f"<ansiyellow>[Pepper] Said:</ansiyellow> \"{message_to_speak} [{animation_tag}]\""))
                  elif message_part == "" and not message_to_speak:
-                    robot_client.play_animation_blocking(animation_tag)
+                    robot_client.play_animation_async(animation_tag)
                     print_formatted_text(HTML(f"<ansiyellow>[Pepper] Said:</ansiyellow> \"[{animation_tag}]\""))
                  
                  found_tag = True
@@ -567,9 +574,9 @@ def pepper_talk_session(robot_client, config, verbose=False):
                     message_to_speak = get_verified_text(session, spell_checker, message_part, tag=animation_tag)
                     
                     if message_to_speak:
-                        # Speak first, then play animation
-                        robot_client.talk(message_to_speak)
-                        robot_client.play_animation_blocking(animation_tag)
+                        # Speak first, then play animation (the speech worker runs them in order)
+                        robot_client.talk_async(message_to_speak)
+                        robot_client.play_animation_async(animation_tag)
                         print_formatted_text(HTML(f"<ansiyellow>[Pepper] Said:</ansiyellow> \"{message_to_speak} [{animation_tag}]\""))
 
                     found_hotkey = True
@@ -583,7 +590,7 @@ def pepper_talk_session(robot_client, config, verbose=False):
             message_to_speak = get_verified_text(session, spell_checker, line)
             
             if message_to_speak:
-                robot_client.talk(message_to_speak)
+                robot_client.talk_async(message_to_speak)
                 print_formatted_text(HTML(f"<ansiyellow>[Pepper] Said:</ansiyellow> \"{message_to_speak}\""))
 
 
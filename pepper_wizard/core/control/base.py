@@ -8,16 +8,28 @@ class ExponentialSmoother:
         self.smoothing = smoothing
         self.value = None
 
+    @property
+    def smoothing(self) -> float:
+        return self._smoothing
+
+    @smoothing.setter
+    def smoothing(self, smoothing: float):
+        # Clamp once here rather than on every update
+        self._smoothing = smoothing
+        self._alpha = max(0.0, min(1.0, 1.0 - smoothing))
+        self._beta = 1.0 - self._alpha
+
     def reset(self):
         self.value = None
 
     def update(self, raw_value: float, dt: float = 0.01) -> float:
-        if self.value is None:
-            self.value = raw_value
+        value = self.value
+        if value is None:
+            value = raw_value
         else:
-            alpha = max(0.0, min(1.0, 1.0 - self.smoothing))
-            self.value = (alpha * raw_value) + ((1.0 - alpha) * self.value)
-        return self.value
+            value = (self._alpha * raw_value) + (self._beta * value)
+        self.value = value
+        return value
 
 class AlphaBetaEstimator:
     """Estimates velocity from position changes using wall-clock timing."""
@@ -6,79 +6,98 @@ class KalmanFilter:
     Constant Velocity Kalman Filter for 2D tracking.
     State: [x, y, dx, dy]
     Measurement: [x, y]
+
+    F, H, Q and R are block-diagonal per axis, so starting from a diagonal
+    P the x and y axes never couple. The filter therefore runs as two
+    hand-unrolled 1D constant-velocity filters on plain floats; at this
+    size NumPy call overhead dwarfs the arithmetic.
     """
     def __init__(self, process_noise=0.1, measurement_noise=1.0):
-        # State Vector [x, y, dx, dy]
-        self.x = np.zeros((4, 1))
-        
-        # Covariance Matrix
-        self.P = np.eye(4) * 10.0
-        
-        # Measurement Matrix (We observe x, y)
-        self.H = np.array([
-            [1, 0, 0, 0],
-            [0, 1, 0, 0]
-        ])
+        # Process Noise (Q = q*I, noise in acceleration jerk)
+        self.q = process_noise
         
-        # Process Noise Covariance (Q)
-        # Assume noise in acceleration jerk
-        self.Q = np.eye(4) * process_noise
+        # Measurement Noise (R = r*I, we observe x, y)
+        self.r = measurement_noise
         
-        # Measurement Noise Covariance (R)
-        self.R = np.eye(2) * measurement_noise
-        
-        self.last_update_time = time.time()
+        self.reset()
         
     def reset(self):
         """Reset state to zero and covariance to initial high-uncertainty."""
-        self.x = np.zeros((4, 1))
-        self.P = np.eye(4) * 10.0
+        # Per-axis state [pos, vel] and covariance [[a, b], [b, d]]
+        self._px = self._vx = 0.0
+        self._py = self._vy = 0.0
+        self._ax, self._bx, self._dx = 10.0, 0.0, 10.0
+        self._ay, self._by, self._dy = 10.0, 0.0, 10.0
         self.last_update_time = time.time()
+
+    @property
+    def x(self):
+        """State vector [x, y, dx, dy] as a (4, 1) array."""
+        return np.array([[self._px], [self._py], [self._vx], [self._vy]])
+
+    @property
+    def P(self):
+        """Full 4x4 covariance matrix."""
+        return np.array([
+            [self._ax, 0.0, self._bx, 0.0],
+            [0.0, self._ay, 0.0, self._by],
+            [self._bx, 0.0, self._dx, 0.0],
+            [0.0, self._by, 0.0, self._dy]
+        ])
         
     def predict(self, dt):
         """
         Predict state forward by dt seconds.
         Returns predicted x, y
         """
-        # State Transition Matrix (F)
-        # x = x + dx*dt
-        F = np.array([
-            [1, 0, dt, 0],
-            [0, 1, 0, dt],
-            [0, 0, 1, 0],
-            [0, 0, 0, 1]
-        ])
+        q = self.q
         
-        # Predict State
-        self.x = F @ self.x
+        # Predict State (x = x + dx*dt)
+        self._px += self._vx * dt
+        self._py += self._vy * dt
         
-        # Predict Covariance
-        self.P = F @ self.P @ F.T + self.Q
+        # Predict Covariance (F P F^T + Q)
+        bx, dx = self._bx, self._dx
+        self._ax += dt * (2.0 * bx + dt * dx) + q
+        self._bx = bx + dt * dx
+        self._dx = dx + q
         
-        return self.x[0,0], self.x[1,0]
+        by, dy = self._by, self._dy
+        self._ay += dt * (2.0 * by + dt * dy) + q
+        self._by = by + dt * dy
+        self._dy = dy + q
+        
+        return self._px, self._py
         
     def update(self, measurement):
         """
         Update with new measurement [x, y].
         """
-        z = np.array(measurement).reshape((2, 1))
-        
-        # Measurement Residual
-        y = z - (self.H @ self.x)
-        
-        # Residual Covariance
-        S = self.H @ self.P @ self.H.T + self.R
-        
-        # Optimal Kalman Gain
-        K = self.P @ self.H.T @ np.linalg.inv(S)
-        
-        # Update State
-        self.x = self.x + (K @ y)
-        
-        # Update Covariance
-        I = np.eye(4)
-        self.P = (I - (K @ self.H)) @ self.P
+        zx, zy = measurement
+        r = self.r
+        
+        # X axis: residual, gain, state and covariance update
+        ax, bx = self._ax, self._bx
+        s = ax + r
+        kp, kv = ax / s, bx / s
+        res = zx - self._px
+        self._px += kp * res
+        self._vx += kv * res
+        self._ax = (1.0 - kp) * ax
+        self._bx = (1.0 - kp) * bx
+        self._dx -= kv * bx
+        
+        # Y axis
+        ay, by = self._ay, self._by
+        s = ay + r
+        kp, kv = ay / s, by / s
+        res = zy - self._py
+        self._py += kp * res
+        self._vy += kv * res
+        self._ay = (1.0 - kp) * ay
+        self._by = (1.0 - kp) * by
+        self._dy -= kv * by
         
         self.last_update_time = time.time()
         
-        return self.x[0,0], self.x[1,0]
+        return self._px, self._py
@@ -1,3 +1,4 @@
+import time
 import numpy as np
 from .base import ExponentialSmoother, AlphaBetaEstimator, TrapezoidalScheduler, SCurveScheduler
 
@@ -11,11 +12,11 @@ class NativeController:
         
     def _init_components(self):
         native_cfg = self.config["native"]
-        scale = np.pi / 180.0
+        self._scale = np.pi / 180.0
         
         # Max Limits
-        max_v = native_cfg["max_vel_deg_s"] * scale
-        max_a = native_cfg["max_accel_deg_s2"] * scale
+        max_v = native_cfg["max_vel_deg_s"] * self._scale
+        max_a = native_cfg["max_accel_deg_s2"] * self._scale
         
         kp = native_cfg["gain_p"]
         kv = native_cfg["gain_v"]
@@ -33,6 +34,22 @@ class NativeController:
         self.scheduler_yaw = TrapezoidalScheduler(max_v, max_a, kp)
         self.scheduler_pitch = TrapezoidalScheduler(max_v, max_a, kp)
 
+        self._cache_params(native_cfg)
+
+    def _cache_params(self, native_cfg):
+        """
+        Precompute per-tick constants from the native config.
+        Re-run whenever the config dict is swapped (tuning.json hot-reload).
+        """
+        self._native_cfg = native_cfg
+        # fov is total FOV, so offset is error * (fov/2)
+        self._half_fov_x = native_cfg["fov_x"] * 0.5
+        self._half_fov_y = native_cfg["fov_y"] * 0.5
+        self._deadzone_x = native_cfg["deadzone_x"]
+        self._deadzone_y = native_cfg["deadzone_y"]
+        self._kd_v = native_cfg["vel_decay"]
+        self._speed = native_cfg["fraction_max_speed"]
+
     def reset(self):
         self.smoother_yaw.reset()
         self.smoother_pitch.reset()
@@ -43,14 +60,14 @@ class NativeController:
 
     def update(self, error_x, error_y, current_yaw, current_pitch, dt=0.01, timestamp=None, current_time=None):
         native_cfg = self.config["native"]
+        if native_cfg is not self._native_cfg:
+            self._cache_params(native_cfg)
         safety_cfg = self.config["safety"]
         
-        fov_x = native_cfg["fov_x"]
-        fov_y = native_cfg["fov_y"]
-        deadzone_x = native_cfg["deadzone_x"]
-        deadzone_y = native_cfg["deadzone_y"]
-        kd_v = native_cfg["vel_decay"]
-        speed = native_cfg["fraction_max_speed"]
+        deadzone_x = self._deadzone_x
+        deadzone_y = self._deadzone_y
+        kd_v = self._kd_v
+        speed = self._speed
         
         # Calculate Latency
         latency = 0.0
@@ -64,9 +81,8 @@ class NativeController:
             if abs(error_y) < deadzone_y: error_y = 0.0
             
             # Map vision error to joint offsets (Radians)
-            # fov_x is total FOV, so offset is error * (fov/2)
-            raw_target_yaw = current_yaw + (error_x * fov_x * 0.5)
-            raw_target_pitch = current_pitch + (error_y * fov_y * 0.5)
+            raw_target_yaw = current_yaw + error_x * self._half_fov_x
+            raw_target_pitch = current_pitch + error_y * self._half_fov_y
             
             # Smoothing
             s_yaw = self.smoother_yaw.update(raw_target_yaw)
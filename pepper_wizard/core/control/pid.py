@@ -1,4 +1,5 @@
 import time
+import types
 
 class PIDController:
     """
@@ -17,7 +18,64 @@ class PIDController:
         self.prev_error = 0.0
         self.integral = 0.0
         self.last_output = 0.0
+
+        # Specialized hot path (see _specialize)
+        self.update = self._specialize()
         
+    def _specialize(self):
+        """
+        Build an update() containing only the stages enabled at construction.
+        Disabled features (deadzone, integral, clamp, slew limit, smoothing)
+        are left out of the generated code rather than tested every tick.
+        Gains are still read from self, so runtime kp changes are honoured;
+        call again if a feature is switched on/off after construction.
+        """
+        src = [
+            "def update(self, error, dt):",
+            "    if dt <= 0.0001:",
+            "        return self.last_output",
+        ]
+        if self.deadzone > 0.0:
+            src += [
+                "    if abs(error) < self.deadzone:",
+                "        error = 0.0",
+                "        self.integral = 0.0",
+            ]
+        src += [
+            "    output = self.kp * error + self.kd * ((error - self.prev_error) / dt)",
+        ]
+        if self.ki != 0.0:
+            src += [
+                "    integral = self.integral + error * dt",
+                "    if integral > 0.5: integral = 0.5",
+                "    if integral < -0.5: integral = -0.5",
+                "    self.integral = integral",
+                "    output += self.ki * integral",
+            ]
+        if self.max_output is not None:
+            src += [
+                "    max_output = self.max_output",
+                "    output = max(min(output, max_output), -max_output)",
+            ]
+        if self.max_acceleration is not None:
+            src += [
+                "    max_change = self.max_acceleration * dt",
+                "    change = max(min(output - self.last_output, max_change), -max_change)",
+                "    output = self.last_output + change",
+            ]
+        if self.output_smoothing > 0.0:
+            src += [
+                "    output = ((1.0 - self.output_smoothing) * output) + (self.output_smoothing * self.last_output)",
+            ]
+        src += [
+            "    self.prev_error = error",
+            "    self.last_output = output",
+            "    return output",
+        ]
+        namespace = {}
+        exec("\n".join(src), namespace)
+        return types.MethodType(namespace["update"], self)
+
     def reset(self):
         self.prev_error = 0.0
         self.integral = 0.0
@@ -28,6 +86,9 @@ class PIDController:
         Calculate control output.
         error: Target - Measured
         dt: Time delta in seconds
+
+        Generic reference path; instances use the specialized variant
+        built by _specialize().
         """
         if dt <= 0.0001:
             return self.last_output
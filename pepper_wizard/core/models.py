@@ -1,11 +1,63 @@
-from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
+from dataclasses import dataclass, field, fields, FrozenInstanceError
+from typing import Optional, List
 
+def _slotted(cls=None, *, extra_slots=()):
+    """
+    Rebuild a dataclass with __slots__ (dataclass(slots=True) needs 3.10+).
+    Drops the per-instance __dict__ on objects created every camera frame.
+    extra_slots: non-field attributes (e.g. caches set in __post_init__);
+    they stay out of fields()/asdict().
+    """
+    if cls is None:
+        return lambda c: _slotted(c, extra_slots=extra_slots)
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names + tuple(extra_slots)
+    for name in field_names:
+        # Defaults live in the generated __init__; class attrs would clash with slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slot_names = cls_dict["__slots__"]
+
+    # Without a __dict__, copy/pickle need explicit state; restore it through
+    # object.__setattr__ as dataclass(slots=True) does (frozen blocks setattr)
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in slot_names)
+
+    def __setstate__(self, state):
+        for name, value in zip(slot_names, state):
+            object.__setattr__(self, name, value)
+
+    cls_dict["__getstate__"] = __getstate__
+    cls_dict["__setstate__"] = __setstate__
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+
+    if cls.__dataclass_params__.frozen:
+        # The generated frozen __setattr__/__delattr__ close over the original
+        # class; rebind them to the rebuilt one
+        def __setattr__(self, name, value):
+            if type(self) is slotted or name in field_names:
+                raise FrozenInstanceError(f"cannot assign to field {name!r}")
+            super(slotted, self).__setattr__(name, value)
+
+        def __delattr__(self, name):
+            if type(self) is slotted or name in field_names:
+                raise FrozenInstanceError(f"cannot delete field {name!r}")
+            super(slotted, self).__delattr__(name)
+
+        slotted.__setattr__ = __setattr__
+        slotted.__delattr__ = __delattr__
+    return slotted
+
+@_slotted
 @dataclass(frozen=True)
 class Point:
     x: float
     y: float
 
+@_slotted(extra_slots=("_center",))
 @dataclass(frozen=True)
 class BBox:
     """Bounding Box in image coordinates."""
@@ -14,9 +66,13 @@ class BBox:
     xmax: float
     ymax: float
 
+    def __post_init__(self):
+        # Memoized center (extra slot, not a field); the box is immutable so it never goes stale
+        object.__setattr__(self, "_center", Point((self.xmin + self.xmax) / 2.0, (self.ymin + self.ymax) / 2.0))
+
     @property
     def center(self) -> Point:
-        return Point((self.xmin + self.xmax) / 2.0, (self.ymin + self.ymax) / 2.0)
+        return self._center
 
     @property
     def width(self) -> float:
@@ -26,6 +82,7 @@ class BBox:
     def height(self) -> float:
         return self.ymax - self.ymin
 
+@_slotted
 @dataclass(frozen=True)
 class Detection:
     """A single tracking detection."""
@@ -33,9 +90,11 @@ class Detection:
     confidence: float
     bbox: BBox
     timestamp: float
-    # Optional raw sensor data at time of capture
-    source_angles: Optional[Tuple[float, float]] = None
+    # Optional raw head angles (radians) at time of capture
+    source_yaw: Optional[float] = None
+    source_pitch: Optional[float] = None
 
+@_slotted
 @dataclass(frozen=True)
 class ControlCommand:
     """Unified output from a tracker."""
@@ -1,8 +1,13 @@
 import time
+from math import fabs
 from ..control.pid import PIDController
 from ..control.filters import KalmanFilter
 from ..control.native import NativeController
-from ..models import Detection
+from ..models import Detection, ControlCommand
+
+# Shared read-only debug payloads (avoid a fresh dict per tick)
+_NATIVE_DEBUG = {"mode": "native"}
+_PID_DEBUG = {"mode": "pid"}
 
 class HeadTracker:
     """
@@ -15,6 +20,12 @@ class HeadTracker:
         self.height = height
         self.config = config or {}
         
+        # Image-centre normalisation constants (pixels -> -1..1)
+        self._half_w = width / 2.0
+        self._half_h = height / 2.0
+        self._inv_half_w = 2.0 / width
+        self._inv_half_h = 2.0 / height
+        
         # Initialize Components
         self._init_components()
         
@@ -42,6 +53,7 @@ class HeadTracker:
             
             # Resolve initial KP
             init_kp = pid_cfg["base_kp"] # Assume base_kp exists as per current tuning.json
+            self._last_adapt_kp = init_kp
                 
             self.pid_yaw = PIDController(
                 kp=init_kp,
@@ -59,6 +71,17 @@ class HeadTracker:
                 max_acceleration=None,
                 deadzone=0.0
             )
+            self._cache_pid_params(pid_cfg)
+
+    def _cache_pid_params(self, pid_cfg):
+        """
+        Hoist per-tick PID config values to attributes.
+        Re-run whenever the config dict is swapped (tuning.json hot-reload).
+        """
+        self._pid_cfg = pid_cfg
+        self._base_kp = pid_cfg["base_kp"]
+        self._boost_kp = pid_cfg["boost_kp"]
+        self._default_speed = pid_cfg["default_speed"]
 
     def reset(self):
         """Reset all internal state to start fresh."""
@@ -84,8 +107,10 @@ class HeadTracker:
             current_state: (yaw, pitch) angles of robot head.
             
         Returns:
-            dict: Structured control command.
+            ControlCommand: "position" or "velocity" command, or None.
         """
+        # One clock read per tick. Wall clock because detection timestamps
+        # (and hence the latency term) are wall clock; the clamp bounds steps.
         now = time.time()
         dt = now - self.last_update_time
         # SAFETY CLAMP
@@ -94,37 +119,9 @@ class HeadTracker:
         if dt < safety_cfg["min_dt"]: dt = safety_cfg["min_dt"]
         self.last_update_time = now
         
-        # 1. State Estimation (Predict)
-        pred_x, pred_y = self.kf.predict(dt + self.latency_comp)
-        target_x, target_y = pred_x, pred_y
-        
-        # 2. Update Filter (Correct)
-        meas_yaw = None
-        meas_pitch = None
-        
-        if detection:
-            # Update KF with bbox center
-            center = detection.bbox.center
-            target_x, target_y = self.kf.update([center.x, center.y])
-            
-            # Extract synced angles if available
-            if detection.source_angles:
-                meas_yaw, meas_pitch = detection.source_angles
-                
-        # 3. Calculate Errors (Normalized -1 to 1)
-        err_x = -(target_x - (self.width / 2)) / (self.width / 2)
-        err_y = (target_y - (self.height / 2)) / (self.height / 2)
-        
-        # 4. Control Strategy
+        # Control Strategy
         if self.control_mode == "native":
             curr_yaw, curr_pitch = current_state if current_state else (None, None)
-            
-            # Use Synced Angles if available
-            # REQUIRED FOR RAW MODE: Error is relative to the Capture Frame (meas_yaw).
-            # Use meas_yaw to reconstruct the correct component of the Global Target.
-            if meas_yaw is not None and meas_pitch is not None:
-                 curr_yaw = meas_yaw
-                 curr_pitch = meas_pitch
 
             # HYBRID - RAW MODE:
             # - When detection exists: Use RAW BBox Error. Bypass KF (it overshoots on egomotion).
@@ -136,40 +133,51 @@ class HeadTracker:
             
             if detection:
                 center = detection.bbox.center
-                calc_err_x = -(center.x - (self.width / 2)) / (self.width / 2)
-                calc_err_y = (center.y - (self.height / 2)) / (self.height / 2)
+                calc_err_x = -(center.x - self._half_w) * self._inv_half_w
+                calc_err_y = (center.y - self._half_h) * self._inv_half_h
                 det_ts = detection.timestamp
+                
+                # Use Synced Angles if available
+                # REQUIRED FOR RAW MODE: Error is relative to the Capture Frame (source_yaw).
+                # Use source_yaw to reconstruct the correct component of the Global Target.
+                if detection.source_yaw is not None and detection.source_pitch is not None:
+                    curr_yaw = detection.source_yaw
+                    curr_pitch = detection.source_pitch
 
-            target_yaw, target_pitch, speed = self.native_ctrl.update(calc_err_x, calc_err_y, curr_yaw, curr_pitch, dt, det_ts, current_time=time.time())
+            target_yaw, target_pitch, speed = self.native_ctrl.update(calc_err_x, calc_err_y, curr_yaw, curr_pitch, dt, det_ts, current_time=now)
             
             if target_yaw is not None:
-                return {
-                    "type": "position",
-                    "yaw": target_yaw,
-                    "pitch": target_pitch,
-                    "speed": speed,
-                    "debug": {"mode": "native"}
-                }
+                return ControlCommand("position", target_yaw, target_pitch, speed, _NATIVE_DEBUG)
             return None
 
         else:
+            # State Estimation (Predict). Only the PID path consumes the KF;
+            # native mode bypasses it, so it is not stepped there at all.
+            target_x, target_y = self.kf.predict(dt + self.latency_comp)
+            
+            # Update Filter (Correct)
+            if detection:
+                center = detection.bbox.center
+                target_x, target_y = self.kf.update([center.x, center.y])
+            
+            # Calculate Errors (Normalized -1 to 1)
+            err_x = -(target_x - self._half_w) * self._inv_half_w
+            err_y = (target_y - self._half_h) * self._inv_half_h
+            
             # PID VELOCITY CONTROL
-            pid_cfg = self.config["pid"]
-            if "base_kp" in pid_cfg:
-                 base_kp = pid_cfg["base_kp"]
-                 boost_kp = pid_cfg["boost_kp"]
-                 total_error = max(abs(err_x), abs(err_y))
-                 adaptive_kp = base_kp + (boost_kp * total_error)
-                 self.pid_yaw.kp = adaptive_kp
-                 self.pid_pitch.kp = adaptive_kp
+            if self.config["pid"] is not self._pid_cfg:
+                self._cache_pid_params(self.config["pid"])
+            abs_x = fabs(err_x)
+            abs_y = fabs(err_y)
+            total_error = abs_x if abs_x > abs_y else abs_y
+            adaptive_kp = self._base_kp + (self._boost_kp * total_error)
+            # Hysteresis: only push a new gain when it moved meaningfully
+            if fabs(adaptive_kp - self._last_adapt_kp) > 1e-4:
+                self.pid_yaw.kp = adaptive_kp
+                self.pid_pitch.kp = adaptive_kp
+                self._last_adapt_kp = adaptive_kp
             
             yaw_vel = self.pid_yaw.update(err_x, dt)
             pitch_vel = self.pid_pitch.update(err_y, dt)
             
-            return {
-                "type": "velocity",
-                "yaw": yaw_vel,
-                "pitch": pitch_vel,
-                "speed": pid_cfg["default_speed"],
-                "debug": {"mode": "pid"}
-            }
+            return ControlCommand("velocity", yaw_vel, pitch_vel, self._default_speed, _PID_DEBUG)
@@ -8,6 +8,21 @@ import time
 
 TO_RAD = 0.017453292519943295
 
+# Task posture for gaze_at_marker (both arms, right then left)
+_JOINT_NAMES_LR = ("RShoulderPitch", "RShoulderRoll", "RElbowYaw", "RElbowRoll", "RWristYaw",
+                   "LShoulderPitch", "LShoulderRoll", "LElbowYaw", "LElbowRoll", "LWristYaw")
+_ARM_LR_ANGLES_DEG = (45, -0.5, 0, 36, 90, 45, -0.5, 0, -36, -90)
+_ARM_LR_ANGLES_RAD = tuple(x * TO_RAD for x in _ARM_LR_ANGLES_DEG)
+
+# ALLandMarkDetection extractor period. ALMemory events cannot be pushed
+# through the HTTP shim, so the search loop polls at this same cadence;
+# each poll is a getData RPC, so keep it at 500 ms rather than faster.
+_LANDMARK_PERIOD_S = 0.5
+
+# Autonomous abilities suppressed while searching for the marker
+_AUTONOMOUS_ABILITIES = ("BackgroundMovement", "BasicAwareness", "ListeningMovement",
+                         "SpeakingMovement", "AutonomousBlinking")
+
 def gaze_at_marker(robot_client, marker_id, marker_size, search_timeout):
     """
     Makes the robot find and gaze at a specific NAOqi marker.
@@ -27,18 +42,17 @@ def gaze_at_marker(robot_client, marker_id, marker_size, search_timeout):
 
     # --- Disable SocialState and Autonomous Behaviors ---
     print("Disabling autonomous behaviors for landmark search...")
-    alife.setAutonomousAbilityEnabled("BackgroundMovement", False)
-    alife.setAutonomousAbilityEnabled("BasicAwareness", False)
-    alife.setAutonomousAbilityEnabled("ListeningMovement", False) 
-    alife.setAutonomousAbilityEnabled("SpeakingMovement", False)
-    alife.setAutonomousAbilityEnabled("AutonomousBlinking", False)
+    # ALAutonomousLife has no batch setter; post() queues each toggle
+    # without waiting for the previous one to complete on the robot.
+    for ability in _AUTONOMOUS_ABILITIES:
+        alife.post("setAutonomousAbilityEnabled", ability, False)
 
     face_service.setTrackingEnabled(False)
     awareness_service.setEnabled(False)
 
     # --- Tracker setup ---
     print("Setting up tracker...")
-    landmark_service.subscribe("Test_LandMark", 500, 0.0)
+    landmark_service.subscribe("Test_LandMark", int(_LANDMARK_PERIOD_S * 1000), 0.0)
     tracker_service.unregisterAllTargets()
     tracker_service.setEffector("None") 
     tracker_service.toggleSearch(False) 
@@ -62,12 +76,7 @@ def gaze_at_marker(robot_client, marker_id, marker_size, search_timeout):
 
     motion_service.setExternalCollisionProtectionEnabled("RArm", False)
     motion_service.setExternalCollisionProtectionEnabled("LArm", False)
-    joint_names_lr = ("RShoulderPitch", "RShoulderRoll", "RElbowYaw", "RElbowRoll", "RWristYaw",
-                      "LShoulderPitch", "LShoulderRoll", "LElbowYaw", "LElbowRoll", "LWristYaw")
-    
-    arm_lr_angles_deg = [45, -0.5, 0, 36, 90, 45, -0.5, 0, -36, -90]
-    arm_lr_angles_rad = [x * TO_RAD for x in arm_lr_angles_deg]
-    motion_service.setAngles(joint_names_lr, arm_lr_angles_rad, 0.1)
+    motion_service.setAngles(_JOINT_NAMES_LR, _ARM_LR_ANGLES_RAD, 0.1)
     print("Robot has successfully entered task posture.")
 
     # --- Landmark Detection Loop ---
@@ -106,7 +115,7 @@ def gaze_at_marker(robot_client, marker_id, marker_size, search_timeout):
 
         if not landmark_found:
             print(f"Searching for landmark... {round((search_timeout - time_elapsed), 1)}s remaining.")
-            time.sleep(0.5)
+            time.sleep(_LANDMARK_PERIOD_S)
 
     landmark_service.unsubscribe("Test_LandMark")
     
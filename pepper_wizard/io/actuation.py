@@ -1,22 +1,44 @@
 from threading import Thread, Event
 import time
-import queue
+
+HEAD_JOINTS = ["HeadYaw", "HeadPitch"]
+# Pepper head joint limits (radians)
+HEAD_YAW_LIMIT = 2.0857
+HEAD_PITCH_MIN = -0.7068
+HEAD_PITCH_MAX = 0.6371
 
 class RobotActuator(Thread):
     """
     Decoupled Actuator Thread.
-    Consumes commands from a queue and sends them to RobotClient.
+    Consumes the latest command and sends it to RobotClient.
     Runs at a fixed frequency to prevent overloading Naoqi.
     """
     def __init__(self, robot_client, frequency=50.0):
         super().__init__()
         self.client = robot_client
+        self._bind_services()
         self.frequency = frequency
         self.period = 1.0 / frequency
         self._stop_event = Event()
-        self.command_queue = queue.Queue(maxsize=1) # Only keep latest command
+        # Latest-command slot: producers overwrite, consumer takes on signal
+        self._latest_cmd = None
+        self._cmd_event = Event()
+        # Integrated head target for velocity commands (seeded from sensors)
+        self._target_yaw = None
+        self._target_pitch = None
         self.daemon = True
         
+    def _bind_services(self):
+        """Resolve client entry points once instead of on every call."""
+        client = self.client
+        # Prefer the async post path so a slow robot doesn't stall the cadence
+        self._set_angles = getattr(client, "post_set_angles", client.set_angles)
+        if hasattr(client, 'set_stiffnesses'):
+            self._set_stiffnesses = client.set_stiffnesses
+        else:
+            # Fallback if accessed via direct proxy
+            self._set_stiffnesses = client.ALMotion.setStiffnesses
+
     def start_service(self):
         """Interface compatibility."""
         if not self.is_alive():
@@ -31,11 +53,7 @@ class RobotActuator(Thread):
     def set_stiffness(self, val):
         """Set head stiffness directly (blocking/immediate)."""
         try:
-            if hasattr(self.client, 'set_stiffnesses'):
-                 self.client.set_stiffnesses("Head", val)
-            else:
-                 # Fallback if accessed via direct proxy
-                 self.client.ALMotion.setStiffnesses("Head", val)
+            self._set_stiffnesses("Head", val)
         except Exception as e:
             print(f"Error setting stiffness: {e}")
 
@@ -49,59 +67,70 @@ class RobotActuator(Thread):
         }
         self._send_internal(cmd)
 
-    def set_head_velocity(self, yaw_vel, pitch_vel):
-        """Queue a velocity command."""
+    def set_head_velocity(self, yaw_vel, pitch_vel, speed=0.2):
+        """Queue a velocity command (rad/s), integrated into position targets."""
         cmd = {
             "type": "velocity",
             "yaw": yaw_vel,
-            "pitch": pitch_vel
+            "pitch": pitch_vel,
+            "speed": speed
         }
         self._send_internal(cmd)
 
     def _send_internal(self, command):
         """
-        Non-blocking send. Overwrites previous command if queue is full.
+        Non-blocking send. Overwrites any command not yet consumed.
         """
-        try:
-            # Empty queue first to ensure we send fresh data
-            while not self.command_queue.empty():
-                self.command_queue.get_nowait()
-        except queue.Empty:
-            pass
-            
-        try:
-            self.command_queue.put_nowait(command)
-        except queue.Full:
-            pass
+        self._latest_cmd = command
+        self._cmd_event.set()
 
     def run(self):
+        # Absolute deadlines: cadence does not drift with send/wait cost
+        next_t = time.monotonic()
         while not self._stop_event.is_set():
-            start_t = time.time()
+            next_t += self.period
             
             try:
-                try:
-                    cmd = self.command_queue.get(timeout=0.1)
-                except queue.Empty:
-                    continue
+                if self._cmd_event.is_set():
+                    # Clear before reading: a command stored after this point
+                    # re-arms the event, so nothing is lost (at worst resent).
+                    self._cmd_event.clear()
+                    cmd = self._latest_cmd
+                else:
+                    cmd = None
                     
-                if cmd['type'] == 'position':
+                if cmd is None:
+                    pass
+                elif cmd['type'] == 'position':
                     speed = cmd.get('speed', 0.1)
                     # Use set_angles for smooth interpolated control
                     # Send both joints in one packet to reduce latency/overhead
                     # and ensure synchronized motion start.
-                    self.client.set_angles(["HeadYaw", "HeadPitch"], [cmd['yaw'], cmd['pitch']], speed)
+                    self._set_angles(HEAD_JOINTS, [cmd['yaw'], cmd['pitch']], speed)
+                    self._target_yaw = cmd['yaw']
+                    self._target_pitch = cmd['pitch']
                     
                 elif cmd['type'] == 'velocity':
-                    # Support velocity control if needed (e.g. for PID)
-                    names = ["HeadYaw", "HeadPitch"]
-                    changes = [cmd['yaw'], cmd['pitch']]
-                    pass
+                    # Integrate velocity (e.g. PID output) over one actuator period
+                    if cmd['yaw'] == 0.0 and cmd['pitch'] == 0.0:
+                        # Stop: hold the last target, re-seed from sensors on resume
+                        self._target_yaw = None
+                    else:
+                        if self._target_yaw is None:
+                            self._target_yaw, self._target_pitch = self.client.get_angles(HEAD_JOINTS, True)
+                        yaw = self._target_yaw + cmd['yaw'] * self.period
+                        pitch = self._target_pitch + cmd['pitch'] * self.period
+                        self._target_yaw = max(-HEAD_YAW_LIMIT, min(HEAD_YAW_LIMIT, yaw))
+                        self._target_pitch = max(HEAD_PITCH_MIN, min(HEAD_PITCH_MAX, pitch))
+                        self._set_angles(HEAD_JOINTS, [self._target_yaw, self._target_pitch], cmd.get('speed', 0.2))
 
             except Exception as e:
                 print(f"Actuator Error: {e}")
                 
-            # Sleep to maintain frequency
-            elapsed = time.time() - start_t
-            sleep_t = self.period - elapsed
+            # Sleep until the next deadline
+            sleep_t = next_t - time.monotonic()
             if sleep_t > 0:
                 time.sleep(sleep_t)
+            elif sleep_t < -self.period:
+                # Overran by more than a tick (e.g. slow RPC): resync rather than burst
+                next_t = time.monotonic()
@@ -6,7 +6,20 @@ from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.layout import Layout
 from prompt_toolkit.layout.containers import Window
 from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.formatted_text import HTML
+
+# Axis indices into the velocity / timestamp lists
+AXIS_X, AXIS_Y, AXIS_THETA = 0, 1, 2
+
+# Primitive motion actions -> (axis, sign). Combined actions such as
+# 'forward_strafe_left' drive every primitive they contain.
+_AXIS_ACTIONS = {
+    'forward': (AXIS_X, 1.0),
+    'backward': (AXIS_X, -1.0),
+    'strafe_left': (AXIS_Y, 1.0),
+    'strafe_right': (AXIS_Y, -1.0),
+    'turn_left': (AXIS_THETA, 1.0),
+    'turn_right': (AXIS_THETA, -1.0),
+}
 
 class KeyboardTeleopController(BaseTeleopController):
     """
@@ -19,10 +32,8 @@ class KeyboardTeleopController(BaseTeleopController):
         self.kb_config = self.config.keyboard_config
         self.watchdog_timeout = self.kb_config.get("watchdog_timeout", 0.2)
         
-        # Current velocities
-        self.vx = 0.0
-        self.vy = 0.0
-        self.vtheta = 0.0
+        # Current velocities [x, y, theta]
+        self._vel = [0.0, 0.0, 0.0]
         
         # Speed multipliers (can be adjusted at runtime)
         self.speed_multiplier = 1.0
@@ -30,16 +41,37 @@ class KeyboardTeleopController(BaseTeleopController):
         self.min_multiplier = self.kb_config.get("min_speed_multiplier", 0.1)
         self.max_multiplier = self.kb_config.get("max_speed_multiplier", 2.0)
         
-        # Last key press time for watchdog (per axis)
-        self.last_time_x = 0
-        self.last_time_y = 0
-        self.last_time_theta = 0
+        # Resolve key mapping and base speeds once (not per keypress)
+        self._mapping = dict(self.kb_config.get("key_mapping", {}))
+        speeds = self.config.teleop_config.get("speeds", {})
+        self._bases = [speeds.get("v_x", 0.2), speeds.get("v_y", 0.2), speeds.get("v_theta", 0.5)]
+        self._recompute_scaled()
+        
+        # Action -> ((axis, sign), ...) dispatch table, built from the mapping
+        self._action_table = {
+            action: tuple(entry for name, entry in _AXIS_ACTIONS.items() if name in action)
+            for action in set(self._mapping.values())
+        }
+        
+        # Last key press time for watchdog (per axis, monotonic clock)
+        now = time.monotonic()
+        self._axis_times = [now, now, now]
+        # Last (x, y, theta) sent to the robot; identical repeats are skipped
+        self._last_sent = None
         
         self.active_keys = set()
+        # Guards velocity/timestamp state only; never held across an RPC
         self.lock = threading.Lock()
+        # Serialises move_toward calls so sends always go out in state order
+        self._send_lock = threading.Lock()
+        # Wakes the watchdog early when a key (re)arms an axis deadline
+        self._wake = threading.Event()
         
         # Application instance
         self.app = None
+        # Last rendered status text, rebuilt only when the shown values change
+        self._ui_cache_key = None
+        self._ui_cache_text = None
 
     def run(self):
         """Main loop for keyboard teleop."""
@@ -56,33 +88,22 @@ class KeyboardTeleopController(BaseTeleopController):
         self.watchdog_thread.start()
 
         # Setup prompt_toolkit application
-        kb = KeyBindings()
-        
-        # Helper to register keys
-        mapping = self.kb_config.get("key_mapping", {})
-        
-        @kb.add('c-c')
-        def _(event):
-            event.app.exit()
-
-        # Dynamic binding based on config
-        keys_to_bind = list(mapping.keys())
-        
-        for k in keys_to_bind:
-            try:
-                @kb.add(k)
-                def _(event, key_bind=k):
-                    self._handle_key(key_bind)
-            except Exception as e:
-                print(f"Warning: Could not bind key '{k}': {e}")
+        kb = self._build_key_bindings()
 
         # Simple UI
         def get_text():
-            return HTML(
-                f"<b>Keyboard Teleop Running</b>\n"
-                f"Speed: {self.speed_multiplier:.1f}x (Step: {self.speed_step})\n"
-                f"Cmd: x={self.vx:.2f}, y={self.vy:.2f}, theta={self.vtheta:.2f}\n"
-                f"<i>Press 'Ctrl-C' to stop</i>")
+            vx, vy, vtheta = self._vel
+            key = (self.speed_multiplier, vx, vy, vtheta)
+            if key != self._ui_cache_key:
+                self._ui_cache_key = key
+                # Plain (style, text) fragments; no markup to parse
+                self._ui_cache_text = [
+                    ("bold", "Keyboard Teleop Running"),
+                    ("", f"\nSpeed: {self.speed_multiplier:.1f}x (Step: {self.speed_step})\n"
+                         f"Cmd: x={vx:.2f}, y={vy:.2f}, theta={vtheta:.2f}\n"),
+                    ("italic", "Press 'Ctrl-C' to stop"),
+                ]
+            return self._ui_cache_text
 
 
         self.app = Application(
@@ -99,82 +120,132 @@ class KeyboardTeleopController(BaseTeleopController):
         finally:
              # Stop signal
             teleop_running.set()
+            self._wake.set()
             self.stop_robot()
             print(" --- Keyboard Teleoperation Finished ---")
 
+    def _build_key_bindings(self):
+        """Bind every mapped key to one shared dispatcher."""
+        kb = KeyBindings()
+        
+        @kb.add('c-c')
+        def _(event):
+            event.app.exit()
+
+        # Parsed key (Keys enum or char) -> key name as written in the config
+        key_names = {}
+        
+        def _dispatch(event):
+            self._handle_key(key_names[event.key_sequence[-1].key])
+
+        # Dynamic binding based on config
+        for k in self._mapping:
+            try:
+                kb.add(k)(_dispatch)
+                key_names[kb.bindings[-1].keys[0]] = k
+            except Exception as e:
+                print(f"Warning: Could not bind key '{k}': {e}")
+        return kb
+
+    @property
+    def vx(self):
+        return self._vel[AXIS_X]
+
+    @property
+    def vy(self):
+        return self._vel[AXIS_Y]
+
+    @property
+    def vtheta(self):
+        return self._vel[AXIS_THETA]
+
+    def _recompute_scaled(self):
+        """Refresh the multiplier-scaled base speeds."""
+        self._scaled = [base * self.speed_multiplier for base in self._bases]
+
     def _handle_key(self, key_name):
         """Process a key press event."""
         with self.lock:
-            now = time.time()
-            mapping = self.kb_config.get("key_mapping", {})
-            action = mapping.get(key_name)
+            now = time.monotonic()
+            action = self._mapping.get(key_name)
             
             if not action:
                  return
 
             if action == 'increase_speed':
                 self.speed_multiplier = min(self.max_multiplier, self.speed_multiplier + self.speed_step)
+                self._recompute_scaled()
                 return
             elif action == 'decrease_speed':
                 self.speed_multiplier = max(self.min_multiplier, self.speed_multiplier - self.speed_step)
+                self._recompute_scaled()
                 return
 
-            # Get base speeds
-            speeds = self.config.teleop_config.get("speeds", {})
-            base_vx = speeds.get("v_x", 0.2) * self.speed_multiplier
-            base_vy = speeds.get("v_y", 0.2) * self.speed_multiplier
-            base_vtheta = speeds.get("v_theta", 0.5) * self.speed_multiplier
-
             # Update Velocities & Timestamps
-            if 'forward' in action:
-                self.vx = base_vx
-                self.last_time_x = now
-            if 'backward' in action:
-                self.vx = -base_vx
-                self.last_time_x = now
-            
-            # Check for strafe 
-            if 'strafe_left' in action:
-                self.vy = base_vy
-                self.last_time_y = now
-            if 'strafe_right' in action:
-                self.vy = -base_vy
-                self.last_time_y = now
-
-            if 'turn_left' in action:
-                self.vtheta = base_vtheta
-                self.last_time_theta = now
-            if 'turn_right' in action:
-                self.vtheta = -base_vtheta
-                self.last_time_theta = now
+            vel = self._vel
+            for axis, sign in self._action_table.get(action, ()):
+                vel[axis] = sign * self._scaled[axis]
+                self._axis_times[axis] = now
             
-            self.robot_client.move_toward(self.vx, self.vy, self.vtheta)
-            if self.app:
-                self.app.invalidate()
+        self._wake.set()
+        # moveToward holds its velocity on the robot, so autorepeat of a
+        # held key only needs to refresh the watchdog timestamps above.
+        if self._send_velocity() and self.app:
+            self.app.invalidate()
 
-    def _watchdog_loop(self):
-        """Monitor key activity per axis and stop component if idle."""
-        while not teleop_running.is_set():
-            time.sleep(0.05)
-            now = time.time()
+    def _send_velocity(self):
+        """
+        Send the current velocity if it differs from the last one sent.
+        Call without self.lock held: the state is snapshotted under it, but
+        the RPC runs outside so the watchdog is never blocked on the network.
+        """
+        with self._send_lock:
             with self.lock:
+                cur = tuple(self._vel)
+            if cur == self._last_sent:
+                return False
+            self.robot_client.move_toward(*cur)
+            self._last_sent = cur
+            return True
+
+    def _watchdog_loop(self):
+        """
+        Monitor key activity per axis and stop component if idle.
+        Sleeps until the earliest per-axis deadline instead of polling; a
+        key press wakes it early to pick up newly armed axes.
+        """
+        # Loop-invariant lookups bound once
+        lock = self.lock
+        wake = self._wake
+        vel = self._vel
+        times = self._axis_times
+        timeout_s = self.watchdog_timeout
+        stopped = teleop_running.is_set
+        monotonic = time.monotonic
+        axes = (AXIS_X, AXIS_Y, AXIS_THETA)
+
+        while not stopped():
+            # Clear before inspecting state so a key press during the
+            # check still wakes the wait below.
+            wake.clear()
+            now = monotonic()
+            with lock:
                 changed = False
-                # Check X Axis
-                if self.vx != 0 and (now - self.last_time_x > self.watchdog_timeout):
-                    self.vx = 0
-                    changed = True
-                
-                # Check Y Axis
-                if self.vy != 0 and (now - self.last_time_y > self.watchdog_timeout):
-                    self.vy = 0
-                    changed = True
-
-                # Check Theta Axis
-                if self.vtheta != 0 and (now - self.last_time_theta > self.watchdog_timeout):
-                    self.vtheta = 0
-                    changed = True
-                
-                if changed:
-                    self.robot_client.move_toward(self.vx, self.vy, self.vtheta)
-                    if self.app:
-                        self.app.invalidate()
+                deadlines = []
+                for axis in axes:
+                    if vel[axis] != 0:
+                        if now - times[axis] > timeout_s:
+                            vel[axis] = 0.0
+                            changed = True
+                        else:
+                            deadlines.append(times[axis])
+            
+            if changed and self._send_velocity() and self.app:
+                self.app.invalidate()
+            
+            if deadlines:
+                timeout = max(0.0, min(deadlines) + timeout_s - now)
+            else:
+                # Idle: still re-check the stop flag periodically
+                timeout = 0.5
+            wake.wait(timeout)
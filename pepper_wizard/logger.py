@@ -1,16 +1,33 @@
 import logging
+import logging.handlers
 import json
 import datetime
+import time
 import sys
 import os
+import queue
+
+# Shared compact encoder; avoids json.dumps re-validating options per call
+_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
 
 class JSONFormatter(logging.Formatter):
     """
     Formatter to output logs in JSON Lines format.
     """
+    # (whole second, ISO prefix) of the last formatted record
+    _ts_cache = (None, "")
+
     def format(self, record):
+        created = record.created
+        sec = int(created)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            # ISO-8601 local time, rebuilt once per second of log output
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+            self._ts_cache = (sec, prefix)
+        timestamp = "%s.%06d" % (prefix, int((created - sec) * 1e6))
         log_record = {
-            "timestamp": datetime.datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": timestamp,
             "level": record.levelname,
             "component": record.name,
             "event": record.msg,  # treating the main message as the 'event' name
@@ -20,7 +37,47 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_record)
+        return _ENCODE(log_record)
+
+class BufferedJSONFileHandler(logging.FileHandler):
+    """
+    FileHandler that lets an 8 KB buffer batch writes.
+    Records are flushed immediately only at WARNING and above; the rest reach
+    disk when the buffer fills or the handler is flushed/closed.
+    """
+    def __init__(self, filename, mode='a', encoding='utf-8'):
+        super().__init__(filename, mode=mode, encoding=encoding, delay=True)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=8192, encoding=self.encoding)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() also flushes the buffered handlers."""
+    def stop(self):
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues the record untouched.
+    The stock prepare() formats the message and drops record.args, which
+    would lose the event payload JSONFormatter writes as "data".
+    """
+    def prepare(self, record):
+        return record
 
 def setup_logging(session_id=None, log_file=None, verbose=False):
     """
@@ -31,6 +88,10 @@ def setup_logging(session_id=None, log_file=None, verbose=False):
                           If None, a timestamp is used.
         log_file (str): Specific path to log file. If provided, overrides dynamic naming.
         verbose (bool): If True, enable DEBUG level and show logs on console.
+
+    Returns:
+        logging.handlers.QueueListener: Background writer for the JSONL file.
+            Call .stop() on shutdown to write out pending records.
     """
     root_logger = logging.getLogger()
     # If verbose, capture DEBUG+. If not, still capture INFO+ for FILE, but filter for CONSOLE.
@@ -60,11 +121,15 @@ def setup_logging(session_id=None, log_file=None, verbose=False):
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
 
     # 1. File Handler (JSONL)
-    file_handler = logging.FileHandler(log_file)
+    file_handler = BufferedJSONFileHandler(log_file)
     file_handler.setFormatter(JSONFormatter())
     # File always gets at least INFO, or DEBUG if verbose
     file_handler.setLevel(logging.INFO if not verbose else logging.DEBUG)
-    root_logger.addHandler(file_handler)
+    # Disk writes happen on a listener thread; callers only enqueue
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(_PassthroughQueueHandler(log_queue))
+    listener = _FlushingQueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
 
     # 2. Console Handler (Human Readable)
     console_handler = logging.StreamHandler(sys.stdout)
@@ -86,9 +151,47 @@ def setup_logging(session_id=None, log_file=None, verbose=False):
     logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
 
     logging.info("LoggingInitialized", {"log_file": log_file})
+    return listener
 
 def get_logger(name):
     """
     Returns a logger instance with the given name.
     """
     return logging.getLogger(name)
+
+class RateLimitedLogger:
+    """
+    Wraps a logger and drops repeats of the same event within `interval` seconds.
+    Meant for error paths inside loops, so a persistent fault logs once per
+    interval instead of once per iteration.
+    """
+    def __init__(self, logger, interval=5.0):
+        self.logger = logger
+        self.interval = interval
+        self._last_emit = {}
+
+    def _allow(self, event):
+        now = time.monotonic()
+        last = self._last_emit.get(event)
+        if last is not None and now - last < self.interval:
+            return False
+        self._last_emit[event] = now
+        return True
+
+    def _emit(self, log, event, data):
+        if self._allow(event):
+            # Forward the payload only when there is one: an empty-dict arg is
+            # not unwrapped by LogRecord and breaks the console's %-formatting
+            if data:
+                log(event, data)
+            else:
+                log(event)
+
+    def info(self, event, data=None):
+        self._emit(self.logger.info, event, data)
+
+    def warning(self, event, data=None):
+        self._emit(self.logger.warning, event, data)
+
+    def error(self, event, data=None):
+        self._emit(self.logger.error, event, data)
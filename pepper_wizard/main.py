@@ -2,14 +2,13 @@
 import argparse
 import signal
 import sys
+import time
 from . import cli
 from .config import load_config
 from .robot_client import RobotClient
 from .command_handler import CommandHandler
 from .recording import RecordingController
 
-from prompt_toolkit import PromptSession
-
 def main():
     """Main function to run the PepperWizard application."""
     parser = argparse.ArgumentParser()
@@ -25,7 +24,7 @@ def main():
 
     # Initialise Logging
     from .logger import setup_logging, get_logger
-    setup_logging(session_id=args.session_id, verbose=args.verbose)
+    log_listener = setup_logging(session_id=args.session_id, verbose=args.verbose)
     logger = get_logger("Main")
 
     cli.print_title()
@@ -37,6 +36,7 @@ def main():
         robot_client = RobotClient(host=args.proxy_ip, port=args.proxy_port, verbose=args.verbose)
     except Exception as e:
         logger.error("RobotConnectionFailed", {"error": str(e)})
+        log_listener.stop()
         sys.exit(1)
 
     print(" --- PepperWizard Ready ---")
@@ -82,20 +82,36 @@ def main():
         raise SystemExit(0)
     signal.signal(signal.SIGTERM, _finalise_recording_on_signal)
 
-    # Start robot status polling thread
-    import threading
-    import time
+    # Start robot status polling (one shared scheduler thread for background polls)
+    from .scheduling import PollScheduler
+    # Poll fast while driving or when something needs attention, slower when
+    # healthy, slowest once the operator has not used the menu for a while
+    min_poll_interval = config.teleop_config.get("min_poll_interval_sec", 10.0)
+    max_poll_interval = config.teleop_config.get("max_poll_interval_sec", 30.0)
+    idle_poll_interval = config.teleop_config.get("idle_poll_interval_sec", 60.0)
+    idle_after = 120.0
+    last_user_action = time.monotonic()
+    backoff_cap = 60.0
+    last_status = None
+    fail_count = 0
+    last_error = None
+
     def poll_robot_status():
-        while True:
-            try:
-                # 1. Battery
-                charge = robot_client.get_battery_charge()
+        """Returns the delay until the next poll."""
+        nonlocal last_status, fail_count, last_error
+        interval = min_poll_interval
+        try:
+            # Battery + Temperature Diagnosis, fetched together
+            bundle = robot_client.get_status_bundle()
+            charge = bundle['battery']
+            severity = bundle['temp_severity']
+            failed_paths = bundle['temp_paths']
+            
+            # Only touch teleop_state when the reading changed
+            status = (charge, severity, tuple(failed_paths or ()))
+            if status != last_status:
+                last_status = status
                 teleop_state['battery'] = charge
-                
-                # 2. Temperature Diagnosis
-                # Returns [severity, [failed_path1, failed_path2, ...]]
-                severity, failed_paths = robot_client.get_temperature_diagnosis()
-                
                 if severity > 0:
                      # 1=Serious, 2=Critical
                      # Extract just the joint names (last part of Device/SubDeviceList/HeadPitch/Temperature/Sensor/Value)
@@ -106,13 +122,30 @@ def main():
                      teleop_state['temp_warning'] = f"{warning_type}: {devices_str}"
                 else:
                      teleop_state['temp_warning'] = None
-
-            except Exception as e:
-                print(f"Status Poll Error: {e}")
-            time.sleep(10) # Poll every 10 seconds
-
-    status_thread = threading.Thread(target=poll_robot_status, daemon=True)
-    status_thread.start()
+            elif (severity == 0 and charge is not None and charge > 40
+                  and not teleop_state.get('teleop_running')):
+                idle = time.monotonic() - last_user_action > idle_after
+                interval = idle_poll_interval if idle else max_poll_interval
+
+            if charge is not None:
+                fail_count = 0
+                last_error = None
+                return interval
+            # Battery read failed: the proxy is most likely unreachable
+            error = "battery unavailable"
+        except Exception as e:
+            error = str(e)
+        # Only log a failure once until it changes or polling recovers
+        if error != last_error:
+            logger.warning("StatusPollError", {"error": error})
+        last_error = error
+        # Back off exponentially while the proxy keeps failing
+        fail_count += 1
+        return min(backoff_cap, min_poll_interval * 2 ** min(fail_count, 3))
+
+    poll_scheduler = PollScheduler(name="RobotStatusPoll")
+    poll_scheduler.add(min_poll_interval, poll_robot_status)
+    poll_scheduler.start()
 
     try:
         while True:
@@ -121,6 +154,7 @@ def main():
 
             # command = cli.user_input(session, "Enter Command: ")
             command = cli.show_main_menu(teleop_state)
+            last_user_action = time.monotonic()
             
             if command is None or command == 'exit': # Handle Cancel or Exit
                 print("Shutting down PepperWizard...")
@@ -128,6 +162,7 @@ def main():
                 break
             
             command_handler.handle_command(command, teleop_state)
+            last_user_action = time.monotonic()
             
     except KeyboardInterrupt:
         print("\nCaught KeyboardInterrupt. Shutting down...")
@@ -136,7 +171,10 @@ def main():
         paths = recording_controller.stop_if_recording()
         if paths:
             print(f"Recording finalised: {paths['mkv']}")
+        poll_scheduler.stop(timeout=1.0)
         command_handler.cleanup()
+        robot_client.close()
+        log_listener.stop()
 
     print(" --- Exiting Pepper Wizard ---")
 
@@ -1,11 +1,14 @@
+import os
 import time
 import zmq
 import json
 import threading
+from collections import deque
 
 from ..core.tracking.head_tracker import HeadTracker
 from ..io.actuation import RobotActuator
 from ..perception.interpreter import PerceptionInterpreter
+from ..logger import get_logger, RateLimitedLogger
 
 
 class TrackingOrchestrator:
@@ -34,9 +37,13 @@ class TrackingOrchestrator:
         self.state = StateClient()
         self.perception = PerceptionClient()
         self.actuator = RobotActuator(robot_client)
+        self.logger = RateLimitedLogger(get_logger("TrackingOrchestrator"))
         
         # Config
-        self.config = self._load_tuning_config()
+        self._cfg_path = os.path.join(os.path.dirname(__file__), "..", "config", "tuning.json")
+        self._cfg_mtime = None  # st_mtime_ns of the last parsed tuning.json
+        self.config = self._load_tuning_config() or {}
+        self._refresh_loop_params()
         
         # Core
         self.tracker = HeadTracker(config=self.config)
@@ -44,38 +51,53 @@ class TrackingOrchestrator:
         
         # State
         self.running = False
+        # Set by stop() to wake the control loop out of its tick wait
+        self._stop_event = threading.Event()
         self.active_target_label = None
+        # Set while a target is active (or on stop); the idle loop waits on it
+        self._target_event = threading.Event()
+        self.target_lost_active = False
+        self._last_stiff = None
         
         # Threading
-        self.lock = threading.Lock()
-        self.last_detection = None
+        # Single-slot handoff from the vision callback to the control loop.
+        # append() overwrites an unconsumed detection, so the loop always
+        # sees the latest one; deque append/popleft are thread-safe.
+        self._det_slot = deque(maxlen=1)
         self.last_measurement_time = 0
         
 
     def _load_tuning_config(self):
-        import json
-        import os
+        """Returns the parsed tuning.json, or None if it is unchanged since the last load."""
         try:
-            config_path = os.path.join(os.path.dirname(__file__), "..", "config", "tuning.json")
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    return json.load(f)
+            mtime = os.stat(self._cfg_path).st_mtime_ns
+        except OSError:
+            return {}
+        if mtime == self._cfg_mtime:
+            return None
+        try:
+            with open(self._cfg_path, "r") as f:
+                cfg = json.load(f)
+            self._cfg_mtime = mtime
+            return cfg
         except Exception as e:
-            print(f"TrackingOrchestrator: Error loading tuning.json: {e}")
+            self.logger.warning("TuningLoadFailed", {"path": self._cfg_path, "error": str(e)})
         return {}
 
+
+    def _refresh_loop_params(self):
+        """Caches the tuning values read by the control loop every tick."""
+        self._target_lost_timeout = self.config.get("native", {}).get("target_lost_timeout", 0.5)
         
     def start(self):
         self.running = True
+        self._stop_event.clear()
         self.state.start()
         # Start Actuator Thread
         self.actuator.start_service()
         # Bind Vision callback
         self.vision.start_receiving(self.on_frame_received)
         
-        # Verify Deadzone
-        native_cfg = self.config.get("native", {})
-        
         # Start Control Loop Thread
         self.control_thread = threading.Thread(target=self._control_loop)
         self.control_thread.daemon = True
@@ -83,6 +105,8 @@ class TrackingOrchestrator:
         
     def stop(self):
         self.running = False
+        self._stop_event.set()
+        self._target_event.set()
         self.vision.stop()
         self.state.stop()
         self.perception.close()
@@ -95,10 +119,15 @@ class TrackingOrchestrator:
     def set_target(self, label):
         self.active_target_label = label
         self.tracker.reset()
+        if label is None:
+            self._target_event.clear()
+        else:
+            self._target_event.set()
 
     def yield_control(self):
         """Used by external behaviors to stop tracking and free resources."""
         self.active_target_label = None
+        self._target_event.clear()
         self.tracker.reset()
         # Ensure head stops moving at next loop
         self.actuator.set_head_velocity(0.0, 0.0)
@@ -113,15 +142,34 @@ class TrackingOrchestrator:
         
         loop_counter = 0
         last_log_time = time.time()
+        stop_event = self._stop_event
+        # Absolute monotonic deadlines: no drift, and the wait sits at the top
+        # so the `continue` paths below are rate-limited too
+        next_tick = time.monotonic()
 
         while self.running:
-            start_time = time.time()
+            if self.active_target_label is None:
+                # Idle: block until a target is set instead of ticking at 100Hz.
+                # The timeout bounds the cost of a set/clear race to one re-check.
+                self._target_event.wait(0.1)
+                next_tick = time.monotonic()
+                continue
+
+            sleep_time = next_tick - time.monotonic()
+            if sleep_time > 0:
+                if stop_event.wait(sleep_time):
+                    break
+            elif sleep_time < -dt_target:
+                # Overran by more than a period; resync instead of bursting
+                next_tick = time.monotonic()
+            next_tick += dt_target
             loop_counter += 1
             
             # Check for active tracking
             
             if self.active_target_label is not None:
                 # 1. Get State
+                # Wall clock: detection timestamps and the state buffer use it
                 now = time.time()
                 robot_state = self.state.get_state_at(now)
                 
@@ -131,26 +179,33 @@ class TrackingOrchestrator:
                 # - If None: Tracker performs "Predict-Only" (smoothing/dead-reckoning).
 
                 detection = None
-                with self.lock:
-                    if self.last_detection:
-                        detection = self.last_detection
-                        self.last_detection = None # Consume it
-                        self.last_measurement_time = detection.timestamp
+                det_slot = self._det_slot
+                if det_slot:
+                    detection = det_slot.popleft() # Consume it (single consumer)
+                    self.last_measurement_time = detection.timestamp
 
                 # Target Loss Recovery Logic
-                target_lost_timeout = self.config.get("native", {}).get("target_lost_timeout", 0.5)
+                target_lost_timeout = self._target_lost_timeout
                 
                 # Check for recovery
-                if detection and getattr(self, 'target_lost_active', False):
+                if detection and self.target_lost_active:
                     self.target_lost_active = False
 
-                # Timeout Check (0.5s default)
-                if self.last_measurement_time > 0 and (now - self.last_measurement_time > target_lost_timeout):
-                    if not getattr(self, 'target_lost_active', False):
-                        self.tracker.reset()
-                        self.actuator.set_head_position(0.0, 0.0, speed=0.1)
-                        self.target_lost_active = True
-                    continue # Skip update/integration while lost
+                if self.last_measurement_time > 0:
+                    lost_for = now - self.last_measurement_time
+                    # Timeout Check (0.5s default)
+                    if lost_for > target_lost_timeout:
+                        if not self.target_lost_active:
+                            self.tracker.reset()
+                            self.actuator.set_head_position(0.0, 0.0, speed=0.1)
+                            self.target_lost_active = True
+                        continue # Skip update/integration while lost
+                    # Hard stop after 1.0s to prevent infinite spinning; only
+                    # reachable when target_lost_timeout is tuned above 1.0s
+                    if lost_for > 1.0:
+                        # Target lost (Non-blocking stop)
+                        self.actuator.set_head_velocity(0.0, 0.0)
+                        continue
                 
                 # Hot-Reload tuning config (Every 1s / 100 frames)
                 if loop_counter % 100 == 0:
@@ -158,34 +213,23 @@ class TrackingOrchestrator:
                     if new_cfg:
                        # Update in-place to ensure references (HeadTracker -> NativeController) see it
                        self.config.update(new_cfg)
+                       self._refresh_loop_params()
                        # Update local vars that depend on it (Stiffnes)
                        stiff_cfg = self.config.get("stiffness", {})
                        val = stiff_cfg.get("min", 0.65) if isinstance(stiff_cfg, dict) else 0.65
-                       if not hasattr(self, '_last_stiff') or self._last_stiff != val:
+                       if self._last_stiff != val:
                            self.actuator.set_stiffness(val)
                            self._last_stiff = val
-                
-                # Timeout Check (1.0s) to prevent infinite spinning
-                if self.last_measurement_time > 0 and (now - self.last_measurement_time > 1.0):
-                    # Target lost (Non-blocking stop)
-                    self.actuator.set_head_velocity(0.0, 0.0)
-                    continue
 
                 cmd = self.tracker.update(detection, robot_state)
                 
                 # 3. Actuate
-                if cmd:
-                    if cmd.get("type") == "position":
-                        self.actuator.set_head_position(cmd["yaw"], cmd["pitch"], cmd["speed"])
+                if cmd is not None:
+                    if cmd.type == "position":
+                        self.actuator.set_head_position(cmd.yaw, cmd.pitch, cmd.speed)
                     else:
                         # Default / PID (Velocity)
-                        self.actuator.set_head_velocity(cmd["yaw"], cmd["pitch"])
-            
-            # Sleep to maintain rate
-            elapsed = time.time() - start_time
-            sleep_time = dt_target - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+                        self.actuator.set_head_velocity(cmd.yaw, cmd.pitch, cmd.speed)
 
     def on_frame_received(self, timestamp, img_bgr):
         """
@@ -206,6 +250,4 @@ class TrackingOrchestrator:
         )
         
         if detection:
-            with self.lock:
-                self.last_detection = detection
-                self.last_measurement_time = timestamp
+            self._det_slot.append(detection)
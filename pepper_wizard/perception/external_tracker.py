@@ -2,21 +2,32 @@ import numpy as np
 import time
 import math
 from ..robot_client import RobotClient
+from ..logger import get_logger, RateLimitedLogger
 
 class ExternalTracker:
     """
     Manages head tracking by sending 3D coordinates to Naoqi's ALTracker.lookAt.
     Projects 2D image coordinates to a fixed-depth 3D plane.
     """
-    def __init__(self, robot_client, target_distance=1.5):
+    # Head Height ~ 1.21m (FRAME_ROBOT z of the projection origin)
+    HEAD_HEIGHT = 1.21
+    
+    def __init__(self, robot_client, target_distance=1.5, deadzone_yaw=0.04, deadzone_pitch=0.15):
         """
         Args:
             robot_client: Instance of RobotClient (wrapper for Naoqi).
             target_distance: Distance in meters to project the target (default 1.5m).
+            deadzone_yaw: Default yaw threshold in radians (0.04 ~ 2.3 deg).
+            deadzone_pitch: Default pitch threshold in radians (0.15 ~ 8.5 deg).
         """
         self.robot_client = robot_client
+        self.logger = RateLimitedLogger(get_logger("ExternalTracker"))
         self.target_distance = target_distance
         
+        # Deadzones are compared squared so look_at needs no abs() calls
+        self._dz_yaw_sq = deadzone_yaw * deadzone_yaw
+        self._dz_pitch_sq = deadzone_pitch * deadzone_pitch
+        
         # Camera Intrinsics (Approximate for Pepper Top Camera)
         # HFOV ~57 deg, VFOV ~44 deg
         self.hfov_rad = 57.0 * (math.pi / 180.0)
@@ -25,15 +36,20 @@ class ExternalTracker:
         self.running = False
         self.frame_robot = 2 # FRAME_ROBOT
         
+        # Resolve the ALTracker proxy once; look_at posts through it every frame
+        tracker = self.robot_client.client.ALTracker
+        self._post_tracker = tracker.post
+        self._stop_tracker = tracker.stopTracker
+        
         # Ensure tracker is ready
         try:
-           self.robot_client.client.ALTracker.stopTracker()
-           self.robot_client.client.ALTracker.unregisterAllTargets()
+           self._stop_tracker()
+           tracker.unregisterAllTargets()
            # It is not strictly necessary to registerTarget for lookAt, but it's good practice to clear.
         except Exception as e:
-            print(f"ExternalTracker Init Warning: {e}")
+            self.logger.warning("TrackerInitWarning", {"error": str(e)})
 
-    def look_at(self, bbox_norm, fraction_speed=0.2, reference_angles=None, deadzone_yaw=0.04, deadzone_pitch=0.15):
+    def look_at(self, bbox_norm, fraction_speed=0.2, reference_angles=None, deadzone_yaw=None, deadzone_pitch=None):
         """
         Commands the robot to look at the center of the bounding box.
         
@@ -41,8 +57,8 @@ class ExternalTracker:
             bbox_norm: [x1, y1, x2, y2] normalized (0.0 to 1.0).
             fraction_speed: Speed fraction (0.0 to 1.0).
             reference_angles: Optional [yaw, pitch] at the time of image capture.
-            deadzone_yaw: Yaw threshold in radians (default 0.04 ~ 2.3 deg).
-            deadzone_pitch: Pitch threshold in radians (default 0.15 ~ 8.5 deg).
+            deadzone_yaw: Yaw threshold in radians (default: the constructor's).
+            deadzone_pitch: Pitch threshold in radians (default: the constructor's).
         """
         # 1. Calculate Center (Normalized)
         cx = (bbox_norm[0] + bbox_norm[2]) / 2.0
@@ -62,15 +78,11 @@ class ExternalTracker:
         
         # 3. Deadzone Filter (Independent Axes)
         # Movement is suppressed only if the target is within tolerance for BOTH axes.
-        if abs(yaw) < deadzone_yaw and abs(pitch) < deadzone_pitch:
+        dz_yaw_sq = self._dz_yaw_sq if deadzone_yaw is None else deadzone_yaw * deadzone_yaw
+        dz_pitch_sq = self._dz_pitch_sq if deadzone_pitch is None else deadzone_pitch * deadzone_pitch
+        if yaw * yaw < dz_yaw_sq and pitch * pitch < dz_pitch_sq:
             return
         
-        # 3. Project to 3D Point (Robot Frame approx)
-        x = self.target_distance
-        y = self.target_distance * math.tan(yaw)
-        z_offset = self.target_distance * math.tan(pitch)
-        
-        
         try:
             curr_yaw, curr_pitch = 0.0, 0.0
 
@@ -78,40 +90,65 @@ class ExternalTracker:
                  # Use the exact angles from when the image was taken
                  curr_yaw, curr_pitch = reference_angles
             else:
-                 print("ExternalTracker Warning: No reference angles provided. Tracking may overshoot.")
+                 # Without capture-time angles the target point would overshoot
+                 self.logger.warning("MissingReferenceAngles")
                  return
                         
             target_yaw = curr_yaw + yaw
-            target_pitch = curr_pitch + pitch
             
             # Project to 3D point in Robot Frame
             # X = r * cos(pitch) * cos(yaw)
             # Y = r * cos(pitch) * sin(yaw)
             # Z = r * sin(pitch) + HeadHeight
+            # Horizontal range uses the image-frame pitch offset; height uses
+            # the Naoqi sign (HeadPitch Positive = Down).
             
-            # Head Height ~ 1.21m
-            head_z = 1.21
+            head_z = self.HEAD_HEIGHT
+            cos, sin = math.cos, math.sin
+            d = self.target_distance
             
-            x_pos = self.target_distance * math.cos(target_pitch) * math.cos(target_yaw)
-            y_pos = self.target_distance * math.cos(target_pitch) * math.sin(target_yaw)
-            z_pos = (self.target_distance * math.sin(-target_pitch)) + head_z 
-            # Standard Naoqi: HeadPitch Positive = Down.
-            pitch_delta = -(off_y * self.vfov_rad)
-            target_pitch = curr_pitch + pitch_delta
-            
-            # Recalculate Z with verified pitch sign
-            z_pos = (self.target_distance * math.sin(-target_pitch)) + head_z
+            r_xy = d * cos(curr_pitch + pitch)
+            x_pos = r_xy * cos(target_yaw)
+            y_pos = r_xy * sin(target_yaw)
+            target_pitch = curr_pitch - pitch
+            z_pos = (d * sin(-target_pitch)) + head_z
             
             point = [x_pos, y_pos, z_pos]
             
             # Send to ALTracker
-            self.robot_client.client.ALTracker.post("lookAt", point, self.frame_robot, fraction_speed, False)
+            self._post_tracker("lookAt", point, self.frame_robot, fraction_speed, False)
             
         except Exception as e:
-            print(f"ExternalTracker Error: {e}")
+            self.logger.error("LookAtFailed", {"error": str(e)})
+
+    def project_batch(self, bboxes_norm, ref_yaw, ref_pitch):
+        """
+        Vectorised form of the look_at projection for several candidates.
+        look_at keeps scalar math: for a single box it is faster than numpy.
+        
+        Args:
+            bboxes_norm: (N, 4) array of [x1, y1, x2, y2] normalized boxes.
+            ref_yaw, ref_pitch: Head angles at the time of image capture.
+        Returns:
+            (N, 3) array of [x, y, z] points in FRAME_ROBOT.
+        """
+        boxes = np.asarray(bboxes_norm, dtype=float).reshape(-1, 4)
+        off_x = 0.5 - (boxes[:, 0] + boxes[:, 2]) * 0.5
+        off_y = 0.5 - (boxes[:, 1] + boxes[:, 3]) * 0.5
+        yaw = off_x * self.hfov_rad
+        pitch = off_y * self.vfov_rad
+        
+        d = self.target_distance
+        target_yaw = ref_yaw + yaw
+        r_xy = d * np.cos(ref_pitch + pitch)
+        points = np.empty((boxes.shape[0], 3))
+        points[:, 0] = r_xy * np.cos(target_yaw)
+        points[:, 1] = r_xy * np.sin(target_yaw)
+        points[:, 2] = d * np.sin(pitch - ref_pitch) + self.HEAD_HEIGHT
+        return points
 
     def stop(self):
         try:
-            self.robot_client.client.ALTracker.stopTracker()
+            self._stop_tracker()
         except:
             pass
@@ -1,15 +1,20 @@
 from typing import Optional, List, Dict, Any
 from ..core.models import Detection, BBox
 
+# Target labels that route through pose landmarks / social head bias
+_PERSON_LABELS = frozenset({"person", "human", "face", "man", "woman"})
+
 class PerceptionInterpreter:
     """
     Decouples raw perception data from the Orchestrator.
     Handles backend-specific data structures (Mediapipe, YOLO) 
     and returns a normalized Detection object.
     """
-    def __init__(self, width: int = 320, height: int = 240):
+    def __init__(self, width: int = 320, height: int = 240, social_head_bias: float = 0.4):
         self.width = width
         self.height = height
+        # Fraction of a person box (from the top) kept as the gaze target; 0 disables
+        self.social_head_bias = social_head_bias
 
     def interpret(self, raw_data: Any, target_label: str, timestamp: float, source_angles: Optional[tuple] = None) -> Optional[Detection]:
         """
@@ -17,25 +22,32 @@ class PerceptionInterpreter:
         """
         if not target_label:
             return None
+        
+        source_yaw, source_pitch = source_angles if source_angles else (None, None)
             
         # 1. Mediapipe Primacy (Person/Face)
-        is_person_target = target_label.lower() in ["person", "human", "face", "man", "woman"]
+        is_person_target = target_label.lower() in _PERSON_LABELS
         
-        if is_person_target and isinstance(raw_data, dict) and "pose_landmarks" in raw_data:
-            pose = raw_data.get("pose_landmarks")
-            if pose and len(pose) > 0:
-                nose = pose[0]
-                # Mediapipe is 0-1 normalized, convert to pixels
-                nx = nose["x"] * self.width
-                ny = nose["y"] * self.height
-                # Create a point-bbox [x, y, x, y]
-                return Detection(
-                    label=target_label,
-                    confidence=1.0, # Landmarks are usually high confidence
-                    bbox=BBox(nx, ny, nx, ny),
-                    timestamp=timestamp,
-                    source_angles=source_angles
-                )
+        pose = raw_data.get("pose_landmarks") if is_person_target and isinstance(raw_data, dict) else None
+        if pose is not None and len(pose) > 0:
+            nose = pose[0]
+            # Landmarks arrive as JSON dicts or as (x, y, visibility) rows
+            if isinstance(nose, dict):
+                nx, ny = nose["x"], nose["y"]
+            else:
+                nx, ny = nose[0], nose[1]
+            # Mediapipe is 0-1 normalized, convert to pixels
+            nx *= self.width
+            ny *= self.height
+            # Create a point-bbox [x, y, x, y]
+            return Detection(
+                label=target_label,
+                confidence=1.0, # Landmarks are usually high confidence
+                bbox=BBox(nx, ny, nx, ny),
+                timestamp=timestamp,
+                source_yaw=source_yaw,
+                source_pitch=source_pitch
+            )
 
         # 2. YOLO / Detection Fallback
         detections_list = []
@@ -44,38 +56,33 @@ class PerceptionInterpreter:
         elif isinstance(raw_data, dict) and "detections" in raw_data:
             detections_list = raw_data["detections"]
             
+        # Seeding the running max with the 0.25 threshold folds both checks
+        # into one compare, tested before the string compare.
         best_det = None
-        max_conf = 0.0
+        max_conf = 0.25
         
         for det in detections_list:
-            if det["class"] == target_label and det["confidence"] > 0.25:
-                if det["confidence"] > max_conf:
-                    max_conf = det["confidence"]
-                    best_det = det
+            conf = det["confidence"]
+            if conf > max_conf and det["class"] == target_label:
+                max_conf = conf
+                best_det = det
         
         if best_det:
-            bx = best_det["bbox"]
+            x1, y1, x2, y2 = best_det["bbox"]
             
-            # Social Bias: If target is a person, bias the center towards the head (Top 20%)
-            if is_person_target:
-                x1, y1, x2, y2 = bx
-                height = y2 - y1
-                # Return a virtual BBox that is focused on the top 40% of the body
-                # The center of this box will be at target_y = y1 + 0.2 * height (the head)
-                return Detection(
-                    label=target_label,
-                    confidence=best_det["confidence"],
-                    bbox=BBox(x1, y1, x2, y1 + (0.4 * height)),
-                    timestamp=timestamp,
-                    source_angles=source_angles
-                )
+            # Social Bias: If target is a person, bias the center towards the head.
+            # The virtual BBox keeps the top `social_head_bias` fraction of the
+            # body, so its center lands at y1 + social_head_bias / 2 * height.
+            if is_person_target and self.social_head_bias > 0:
+                y2 = y1 + self.social_head_bias * (y2 - y1)
 
             return Detection(
                 label=target_label,
-                confidence=best_det["confidence"],
-                bbox=BBox(bx[0], bx[1], bx[2], bx[3]),
+                confidence=max_conf,
+                bbox=BBox(x1, y1, x2, y2),
                 timestamp=timestamp,
-                source_angles=source_angles
+                source_yaw=source_yaw,
+                source_pitch=source_pitch
             )
             
         return None
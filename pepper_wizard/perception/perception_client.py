@@ -1,19 +1,32 @@
 import zmq
 import json
 import cv2
+import itertools
 import time
 
 class PerceptionClient:
     def __init__(self, service_uri="tcp://localhost:5557"):
         self.service_uri = service_uri
         self.context = zmq.Context()
-        self.socket = self.context.socket(zmq.REQ)
+        # DEALER instead of REQ: no strict send/recv state machine, so a timed-out
+        # request does not force the socket to be torn down and reconnected.
+        self.socket = self.context.socket(zmq.DEALER)
+        self.socket.setsockopt(zmq.LINGER, 0)
         self.socket.connect(service_uri)
+        # Each request carries an id frame ahead of the empty delimiter. The REP
+        # server echoes the whole envelope, so late replies can be recognised.
+        self._req_ids = itertools.count(1)
+        # Encoded metadata frame per target label (labels repeat every frame)
+        self._meta_cache = {}
 
     def detect(self, img_bgr, target_label=None):
         """
         Sends image to perception service.
         Returns list of detections or None on timeout/error.
+
+        One frame per request by design: there is a single camera stream and
+        the tracker is closed-loop, so holding a frame back to fill a batch
+        would add a full frame of latency to every correction.
         """
         try:
             # Encode to JPG
@@ -21,23 +34,27 @@ class PerceptionClient:
             
             # Send Request
             # Protocol: [MetadataJSON, ImageBytes]
-            meta = {}
-            if target_label:
-                meta["target"] = target_label
-            
-            self.socket.send_multipart([json.dumps(meta).encode(), img_jpg.tobytes()])
+            meta = self._meta_cache.get(target_label)
+            if meta is None:
+                meta = json.dumps({"target": target_label} if target_label else {}).encode()
+                self._meta_cache[target_label] = meta
             
-            # Wait for Reply (Blocking but fast)
-            if self.socket.poll(1000): # 1s timeout
-                result = self.socket.recv_json()
-                return result.get("data", {})
-            else:
-                # Reset socket on timeout
-                self.socket.close()
-                self.socket = self.context.socket(zmq.REQ)
-                self.socket.connect(self.service_uri)
-                return None
-                
+            # On the wire the payload is preceded by [RequestId, b''].
+            # The encoded buffer is handed to zmq directly (no tobytes() copy)
+            req_id = str(next(self._req_ids)).encode()
+            self.socket.send_multipart([req_id, b'', meta, img_jpg], copy=False)
+
+            # Wait for Reply (Blocking but fast), 1s timeout.
+            # Replies to earlier timed-out requests are dropped as they arrive.
+            deadline = time.monotonic() + 1.0
+            while True:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0 or not self.socket.poll(remaining_ms):
+                    return None
+                frames = self.socket.recv_multipart()
+                if frames[0] == req_id:
+                    return json.loads(frames[-1]).get("data", {})
+
         except Exception as e:
             print(f"PerceptionClient Error: {e}")
             return None
@@ -4,8 +4,23 @@ import numpy as np
 import cv2
 import time
 import threading
+from collections import deque
+
+FRAME_W, FRAME_H = 320, 240
+# Precompiled unpacker for the frame header timestamp (double)
+_unpack_ts = struct.Struct('d').unpack
+# Raw frame layouts keyed by payload length: (array shape, cvtColor code)
+_FRAME_LAYOUTS = {
+    FRAME_W * FRAME_H: ((FRAME_H, FRAME_W), cv2.COLOR_GRAY2BGR),          # Greyscale
+    FRAME_W * FRAME_H * 2: ((FRAME_H, FRAME_W, 2), cv2.COLOR_YUV2BGR_YUYV), # YUYV 422
+}
 
 class VisionReceiver(threading.Thread):
+    """
+    Subscribes to the video stream and hands decoded BGR frames to a callback.
+    This thread only receives; colour conversion and the callback run on a
+    worker thread, so a slow callback never delays draining the socket.
+    """
     def __init__(self, streamer_uri="tcp://localhost:5559"):
         super().__init__()
         self.streamer_uri = streamer_uri
@@ -13,6 +28,15 @@ class VisionReceiver(threading.Thread):
         self.lock = threading.Lock()
         self.latest_frame = None # (timestamp, img_bgr)
         self.callback = None
+        # Preallocated BGR outputs, alternated per frame so the buffer handed
+        # to the callback is not overwritten by the very next conversion.
+        # Callbacks that keep a frame longer than that must copy it.
+        self._bgr_bufs = [np.empty((FRAME_H, FRAME_W, 3), dtype=np.uint8) for _ in range(2)]
+        self._buf_idx = 0
+        # Latest raw (timestamp, bytes) from the receiver; older ones are dropped
+        self._raw_slot = deque(maxlen=1)
+        self._raw_ready = threading.Event()
+        self._worker = None
 
     def start_receiving(self, callback):
         """Register a callback(timestamp, img_bgr) to be called on new frames."""
@@ -21,7 +45,10 @@ class VisionReceiver(threading.Thread):
 
     def stop(self):
         self.running = False
+        self._raw_ready.set()
         self.join()
+        if self._worker is not None:
+            self._worker.join()
 
     def run(self):
         self.running = True
@@ -38,12 +65,20 @@ class VisionReceiver(threading.Thread):
             
         print(f"VisionReceiver: Listening on {self.streamer_uri}")
         
+        self._worker = threading.Thread(target=self._convert_loop, daemon=True)
+        self._worker.start()
+        
         while self.running:
             try:
-                # DRAIN QUEUE: Read all available frames, keep only the last one
+                # DRAIN QUEUE: Read all available frames, keep only the last one.
+                # Non-blocking recv until EAGAIN: one call per queued frame
+                # instead of a poll(0) + recv pair.
                 last_msg = None
-                while socket.poll(0):
-                    last_msg = socket.recv_multipart()
+                try:
+                    while True:
+                        last_msg = socket.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    pass
                 
                 if last_msg is None:
                     # No new data, wait to avoid spin lock (but poll(100) above handles waiting if empty)
@@ -56,7 +91,7 @@ class VisionReceiver(threading.Thread):
                     
                 if len(msg) == 3:
                     topic, header, img_data = msg
-                    timestamp = struct.unpack('d', header)[0]
+                    timestamp = _unpack_ts(header)[0]
                 elif len(msg) == 2:
                     timestamp = time.time()
                     topic, img_data = msg
@@ -64,24 +99,39 @@ class VisionReceiver(threading.Thread):
                     print(f"VisionReceiver: Invalid msg len {len(msg)}")
                     continue
                         
-                # Decode
-                w, h = 320, 240
-                img_bgr = None
-                
-                if len(img_data) == 76800: # Greyscale
-                    img_np = np.frombuffer(img_data, dtype=np.uint8).reshape((h, w))
-                    img_bgr = cv2.cvtColor(img_np, cv2.COLOR_GRAY2BGR)
-                elif len(img_data) == 153600: # YUYV 422
-                    img_np = np.frombuffer(img_data, dtype=np.uint8).reshape((h, w, 2))
-                    img_bgr = cv2.cvtColor(img_np, cv2.COLOR_YUV2BGR_YUYV)
-                else:
-                    print(f"VisionReceiver: Unknown data len {len(img_data)}")
-                
-                if img_bgr is not None and self.callback:
-                    self.callback(timestamp, img_bgr)
+                # Hand off; overwrites a frame the worker has not taken yet
+                self._raw_slot.append((timestamp, img_data))
+                self._raw_ready.set()
             except Exception as e:
                 print(f"VisionReceiver Error: {e}")
                 time.sleep(0.1)
                 
+        self._raw_ready.set() # Let the worker observe running == False
         socket.close()
         context.term()
+
+    def _convert_loop(self):
+        """Worker: converts the latest raw frame to BGR and runs the callback."""
+        while self.running:
+            if not self._raw_ready.wait(0.1):
+                continue
+            # Clear before taking: a frame stored after this re-arms the event
+            self._raw_ready.clear()
+            if not self._raw_slot:
+                continue
+            timestamp, img_data = self._raw_slot.popleft()
+            try:
+                # Decode (OpenCV dispatches these kernels to SIMD at runtime)
+                layout = _FRAME_LAYOUTS.get(len(img_data))
+                if layout is None:
+                    print(f"VisionReceiver: Unknown data len {len(img_data)}")
+                    continue
+                shape, code = layout
+                img_np = np.frombuffer(img_data, dtype=np.uint8).reshape(shape)
+                img_bgr = cv2.cvtColor(img_np, code, dst=self._bgr_bufs[self._buf_idx])
+                self._buf_idx ^= 1
+                
+                if self.callback:
+                    self.callback(timestamp, img_bgr)
+            except Exception as e:
+                print(f"VisionReceiver Error: {e}")
@@ -1,6 +1,24 @@
 # Handles all communication with the robot
+from contextlib import contextmanager
+from time import monotonic
 from naoqi_proxy import NaoqiClient, NaoqiProxyError
 
+# ALAutonomousLife abilities switched together by set_social_state
+_SOCIAL_ABILITIES = ("BackgroundMovement", "BasicAwareness", "ListeningMovement",
+                     "SpeakingMovement", "AutonomousBlinking")
+
+# Joints polled by get_joint_temperatures (standard ALMemory keys for Pepper)
+_TEMP_JOINTS = (
+    "HeadYaw", "HeadPitch",
+    "LShoulderPitch", "LShoulderRoll", "LElbowYaw", "LElbowRoll", "LWristYaw",
+    "RShoulderPitch", "RShoulderRoll", "RElbowYaw", "RElbowRoll", "RWristYaw",
+    "LHipYawPitch", "LHipRoll", "LHipPitch", "LKneePitch", "LAnklePitch", "LAnkleRoll",
+    "RHipYawPitch", "RHipRoll", "RHipPitch", "RKneePitch", "RAnklePitch", "RAnkleRoll",
+    "HipRoll", "HipPitch", "KneePitch" # Common variants or Nao/Pepper differences
+)
+# Device/SubDeviceList/[JointName]/Temperature/Sensor/Value
+_TEMP_KEYS = tuple(f"Device/SubDeviceList/{name}/Temperature/Sensor/Value" for name in _TEMP_JOINTS)
+
 class RobotClient:
     """A wrapper around the NaoqiClient to provide a high-level API for controlling the robot."""
     def __init__(self, host, port, verbose=False):
@@ -12,10 +30,38 @@ class RobotClient:
         # Throttling for high-frequency logs
         self.last_move_log_time = 0
         self.move_log_interval = 0.5 # Log max every 0.5 seconds (2Hz)
+        # move_toward drops commands within move_epsilon of the last one sent
+        # less than move_min_interval seconds ago; (x, y, theta, monotonic_ts)
+        self.move_epsilon = 0.01
+        self.move_min_interval = 0.05
+        self._last_move = None
+        # Worker pool for get_status_bundle, created on first use
+        self._status_pool = None
+        # Set once getTemperatureDiagnosis has returned None; from then on the
+        # ALMemory fallback is fetched alongside it instead of after it
+        self._diag_needs_fallback = False
+        # Single worker for the *_async speech/animation calls (created on
+        # first use); one thread keeps queued utterances in submission order
+        self._speech_pool = None
+        self._speech_future = None
+        # Short-lived cache for the state getters: {key: (monotonic_expiry, value)}.
+        # Setters bump the key's generation before and after their RPC; a read
+        # that overlapped a bump is returned but not cached.
+        self._state_cache = {}
+        self._state_gen = {}
+        self.state_cache_ttl = 0.25
+        # Temperature keys still polled (narrowed to the joints this robot
+        # reports) and the last reading with its monotonic expiry time
+        self._temp_joints = _TEMP_JOINTS
+        self._temp_keys = list(_TEMP_KEYS)
+        self._temp_cache = (0.0, None)
+        self.temp_cache_ttl = 0.5
         try:
             self.client = NaoqiClient(host=host, port=port)
             # Ping a service to ensure connection
             self.client.ALTextToSpeech.getAvailableLanguages()
+            # Bind the motion proxy once; it backs the high-rate calls below
+            self._motion = self.client.ALMotion
         except NaoqiProxyError as e:
             print(f"Failed to connect to PepperBox proxy at {host}:{port}")
             print(f"Error: {e}")
@@ -26,25 +72,52 @@ class RobotClient:
         """Wakes up the robot."""
         print("Waking up robot...")
         self.logger.info("WakeUp")
-        self.client.ALMotion.wakeUp()
+        with self._state_change("awake"):
+            self.client.ALMotion.wakeUp()
         print("Robot is awake.")
 
     def rest(self):
         """Puts the robot to rest."""
         print("Putting robot to rest...")
         self.logger.info("Rest")
-        self.client.ALMotion.rest()
-        self.client.ALMotion.rest()  # Send command twice for robustness
+        # rest() blocks until the posture is reached and raises on failure
+        with self._state_change("awake"):
+            self.client.ALMotion.rest()
         print("Robot is at rest.")
 
     def is_awake(self):
         """Returns True if the robot is awake."""
         try:
              # robotIsWakeUp returns True if awake
-             return self.client.ALMotion.robotIsWakeUp()
+             return self._cached_state("awake", self.client.ALMotion.robotIsWakeUp)
         except Exception:
              return False
 
+    def _cached_state(self, key, fetch):
+        """Returns fetch() through the state cache; exceptions are not cached."""
+        now = monotonic()
+        hit = self._state_cache.get(key)
+        if hit is not None and now < hit[0]:
+            return hit[1]
+        gen = self._state_gen.get(key, 0)
+        value = fetch()
+        if self._state_gen.get(key, 0) == gen:
+            self._state_cache[key] = (now + self.state_cache_ttl, value)
+        return value
+
+    @contextmanager
+    def _state_change(self, key):
+        """Wraps a setter RPC: invalidates the cached getter value on both sides of it."""
+        self._invalidate_state(key)
+        try:
+            yield
+        finally:
+            self._invalidate_state(key)
+
+    def _invalidate_state(self, key):
+        self._state_gen[key] = self._state_gen.get(key, 0) + 1
+        self._state_cache.pop(key, None)
+
     def talk(self, message):
         """Makes the robot say a message."""
         try:
@@ -77,6 +150,38 @@ class RobotClient:
         except NaoqiProxyError as e:
             print(f"Animation Error: {e}")
 
+    def _submit_speech(self, fn, *args):
+        if self._speech_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._speech_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RobotSpeech")
+        self._speech_future = self._speech_pool.submit(fn, *args)
+        return self._speech_future
+
+    def talk_async(self, message):
+        """Queues talk() on the speech worker and returns its Future."""
+        return self._submit_speech(self.talk, message)
+
+    def animated_talk_async(self, animation_tag, message):
+        """Queues animated_talk() on the speech worker and returns its Future."""
+        return self._submit_speech(self.animated_talk, animation_tag, message)
+
+    def play_animation_async(self, animation_name):
+        """Queues play_animation_blocking() on the speech worker and returns its Future."""
+        return self._submit_speech(self.play_animation_blocking, animation_name)
+
+    def is_speaking(self):
+        """Returns True while queued speech or animation is still running."""
+        return self._speech_future is not None and not self._speech_future.done()
+
+    def close(self):
+        """
+        Shuts down the worker pools. Speech or animation already running is
+        allowed to finish; anything still queued behind it is cancelled.
+        """
+        for pool in (self._speech_pool, self._status_pool):
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
     def get_battery_charge(self):
         """Returns the robot's battery charge percentage."""
         try:
@@ -90,46 +195,51 @@ class RobotClient:
     def set_tracking_mode(self, mode_name):
         """Sets the robot's tracking mode directly."""
         print(f"Setting tracking mode to: {mode_name}")
-        try:
-            # 1. Set ALTracker Mode (Low-level)
-            self.client.ALTracker.setMode(mode_name)
-            self.client.ALTracker.setMode(mode_name)  # Send command twice for robustness
-            self.logger.info("TrackingModeSet", {"mode": mode_name})
+        with self._state_change("tracking_mode"):
+            try:
+                # 1. Set ALTracker Mode (Low-level)
+                # Read back the mode and only re-send when the first call did not take
+                tracker = self.client.ALTracker
+                tracker.setMode(mode_name)
+                if tracker.getMode() != mode_name:
+                    tracker.setMode(mode_name)
+                self.logger.info("TrackingModeSet", {"mode": mode_name})
             
-            # 2. Set ALBasicAwareness Mode (High-level Social)
-            # Map standard modes to BasicAwareness modes
-            ba_mode = mode_name
-            if mode_name == "Move":
-                ba_mode = "MoveContextually"
-            elif mode_name == "WholeBody":
-                # "BodyRotation" allows rotation to face the human.
-                ba_mode = "BodyRotation"
+                # 2. Set ALBasicAwareness Mode (High-level Social)
+                # Map standard modes to BasicAwareness modes
+                ba_mode = mode_name
+                if mode_name == "Move":
+                    ba_mode = "MoveContextually"
+                elif mode_name == "WholeBody":
+                    # "BodyRotation" allows rotation to face the human.
+                    ba_mode = "BodyRotation"
             
-            try:
-                self.client.ALBasicAwareness.setTrackingMode(ba_mode)
-                self.logger.info("BasicAwarenessModeSet", {"mode": ba_mode})
-            except Exception as e:
-                # BasicAwareness might not be available or proxy error
-                print(f"Warning: Could not set BasicAwareness mode: {e}")
-        except NaoqiProxyError as e:
-            print(f"Failed to set tracking mode: {e}")
+                try:
+                    self.client.ALBasicAwareness.setTrackingMode(ba_mode)
+                    self.logger.info("BasicAwarenessModeSet", {"mode": ba_mode})
+                except Exception as e:
+                    # BasicAwareness might not be available or proxy error
+                    print(f"Warning: Could not set BasicAwareness mode: {e}")
+            except NaoqiProxyError as e:
+                print(f"Failed to set tracking mode: {e}")
 
     def stop_tracking(self):
         """Stops the native tracker and sets mode to Head for safety."""
         print("Stopping native tracker...")
-        try:
-            self.client.ALTracker.stopTracker()
-            self.client.ALTracker.unregisterAllTargets()
-            # Set to a neutral mode
-            self.client.ALTracker.setMode("Head")
-            self.logger.info("TrackingStopped")
-        except NaoqiProxyError as e:
-            print(f"Failed to stop tracker: {e}")
+        with self._state_change("tracking_mode"):
+            try:
+                self.client.ALTracker.stopTracker()
+                self.client.ALTracker.unregisterAllTargets()
+                # Set to a neutral mode
+                self.client.ALTracker.setMode("Head")
+                self.logger.info("TrackingStopped")
+            except NaoqiProxyError as e:
+                print(f"Failed to stop tracker: {e}")
 
     def get_tracking_mode(self):
         """Returns the current tracking mode."""
         try:
-             return self.client.ALTracker.getMode()
+             return self._cached_state("tracking_mode", self.client.ALTracker.getMode)
         except NaoqiProxyError as e:
              print(f"Failed to get tracking mode: {e}")
              return None
@@ -143,25 +253,28 @@ class RobotClient:
 
     def set_social_state(self, enabled):
         """Idempotently sets the robot's social state."""
-        try:
-            self.client.ALAutonomousLife.setAutonomousAbilityEnabled("BackgroundMovement", enabled)
-            self.client.ALAutonomousLife.setAutonomousAbilityEnabled("BasicAwareness", enabled)
-            self.client.ALAutonomousLife.setAutonomousAbilityEnabled("ListeningMovement", enabled)
-            self.client.ALAutonomousLife.setAutonomousAbilityEnabled("SpeakingMovement", enabled)
-            self.client.ALAutonomousLife.setAutonomousAbilityEnabled("AutonomousBlinking", enabled)
-            self.client.ALFaceDetection.setTrackingEnabled(enabled)
-            self.client.ALBasicAwareness.setEnabled(enabled)
+        with self._state_change("social_state"):
+            try:
+                # ALAutonomousLife has no batch setter; post() queues each toggle
+                # without waiting for the previous one to complete on the robot.
+                alife = self.client.ALAutonomousLife
+                for ability in _SOCIAL_ABILITIES:
+                    alife.post("setAutonomousAbilityEnabled", ability, enabled)
+                self.client.ALFaceDetection.post("setTrackingEnabled", enabled)
+                # The one blocking call: it confirms the proxy is reachable, and
+                # get_social_state reads back exactly this flag.
+                self.client.ALBasicAwareness.setEnabled(enabled)
             
-            self.logger.info("SocialStateSet", {"enabled": enabled})
-            return enabled
-        except NaoqiProxyError as e:
-            print(f"Error setting social state: {e}")
-            return None
+                self.logger.info("SocialStateSet", {"enabled": enabled})
+                return enabled
+            except NaoqiProxyError as e:
+                print(f"Error setting social state: {e}")
+                return None
 
     def get_social_state(self):
         """Returns True if social state (Basic Awareness) is active."""
         try:
-            return self.client.ALBasicAwareness.isEnabled()
+            return self._cached_state("social_state", self.client.ALBasicAwareness.isEnabled)
         except Exception:
             return False
 
@@ -172,34 +285,48 @@ class RobotClient:
 
     def move_toward(self, x, y, theta):
         """Commands the robot to move."""
-        import time 
+        now = monotonic()
+        last = self._last_move
+        if last is not None:
+            lx, ly, lt, last_ts = last
+            # A stop is always sent unless the last command was already a stop
+            stopping = not (x or y or theta) and (lx or ly or lt)
+            if (not stopping
+                    and max(abs(x - lx), abs(y - ly), abs(theta - lt)) < self.move_epsilon
+                    and now - last_ts < self.move_min_interval):
+                return
         try:
             # Throttled Logging
-            now = time.time()
             if now - self.last_move_log_time >= self.move_log_interval:
                 self.logger.info("MoveCommand", {"x": x, "y": y, "theta": theta})
                 self.last_move_log_time = now
                 
-            self.client.ALMotion.moveToward(x, y, theta)
+            self._motion.moveToward(x, y, theta)
+            self._last_move = (x, y, theta, now)
         except NaoqiProxyError as e:
             print(f"Failed to send move command: {e}")
             raise
 
     def stop_move(self):
         """Stops the robot's movement."""
-        self.client.ALMotion.stopMove()
+        self._last_move = None
+        self._motion.stopMove()
 
     def set_stiffnesses(self, body_part, stiffness):
         """Sets the stiffness of a body part."""
-        self.client.ALMotion.setStiffnesses(body_part, stiffness)
+        self._motion.setStiffnesses(body_part, stiffness)
 
     def get_angles(self, names, use_sensors=True):
         """Gets the angles of joints."""
-        return self.client.ALMotion.getAngles(names, use_sensors)
+        return self._motion.getAngles(names, use_sensors)
         
     def set_angles(self, names, angles, fraction_max_speed):
         """Sets the angles of joints (Absolute Position Control)."""
-        self.client.ALMotion.setAngles(names, angles, fraction_max_speed)
+        self._motion.setAngles(names, angles, fraction_max_speed)
+
+    def post_set_angles(self, names, angles, fraction_max_speed):
+        """Fire-and-forget setAngles for high-rate streaming (no result wait)."""
+        self._motion.post("setAngles", names, angles, fraction_max_speed)
 
     def get_joint_temperatures(self):
         """
@@ -207,30 +334,27 @@ class RobotClient:
         Returns:
             dict: {JointName: Temperature_in_Celsius}
         """
-        # Define the list of keys we want to monitor
-        # These are standard ALMemory keys for Pepper
-        joint_names = [
-            "HeadYaw", "HeadPitch",
-            "LShoulderPitch", "LShoulderRoll", "LElbowYaw", "LElbowRoll", "LWristYaw",
-            "RShoulderPitch", "RShoulderRoll", "RElbowYaw", "RElbowRoll", "RWristYaw",
-            "LHipYawPitch", "LHipRoll", "LHipPitch", "LKneePitch", "LAnklePitch", "LAnkleRoll",
-            "RHipYawPitch", "RHipRoll", "RHipPitch", "RKneePitch", "RAnklePitch", "RAnkleRoll",
-            "HipRoll", "HipPitch", "KneePitch" # Common variants or Nao/Pepper differences
-        ]
-        
-        # Construct ALMemory keys: Device/SubDeviceList/[JointName]/Temperature/Sensor/Value
-        memory_keys = [f"Device/SubDeviceList/{name}/Temperature/Sensor/Value" for name in joint_names]
+        now = monotonic()
+        expires, cached = self._temp_cache
+        if cached is not None and now < expires:
+            return cached
         
         try:
             # Use getListData to fetch all in one call
-            temps = self.client.ALMemory.getListData(memory_keys)
+            temps = self.client.ALMemory.getListData(self._temp_keys)
             
             result = {}
-            for i, name in enumerate(joint_names):
-                val = temps[i]
+            for name, val in zip(self._temp_joints, temps):
                 if val is not None:
                      result[name] = val
             
+            # Keys that come back empty on the first good read (Nao-only joints)
+            # are dropped from every later poll
+            if result and self._temp_joints is _TEMP_JOINTS and len(result) < len(_TEMP_JOINTS):
+                self._temp_joints = tuple(result)
+                self._temp_keys = [_TEMP_KEYS[_TEMP_JOINTS.index(name)] for name in self._temp_joints]
+            
+            self._temp_cache = (now + self.temp_cache_ttl, result)
             return result
         except NaoqiProxyError as e:
             # Don't spam logs, this is a polling function
@@ -238,6 +362,31 @@ class RobotClient:
                  print(f"Failed to get temperatures: {e}")
             return {}
 
+    def _get_status_pool(self):
+        if self._status_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            # Battery, diagnosis and the speculative diagnosis fallback
+            self._status_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="RobotStatus")
+        return self._status_pool
+
+    def get_status_bundle(self):
+        """
+        Fetches battery charge and temperature diagnosis in one call.
+        The shim has no batched endpoint, so both requests are issued
+        concurrently and the call costs one round-trip instead of two.
+        Returns:
+            dict: {'battery': int|None, 'temp_severity': int, 'temp_paths': list<str>}
+        """
+        pool = self._get_status_pool()
+        battery = pool.submit(self.get_battery_charge)
+        diagnosis = pool.submit(self.get_temperature_diagnosis)
+        severity, failed_paths = diagnosis.result()
+        return {
+            'battery': battery.result(),
+            'temp_severity': severity,
+            'temp_paths': failed_paths,
+        }
+
     def get_temperature_diagnosis(self):
         """
         Retrieves the temperature diagnosis from ALBodyTemperature.
@@ -245,18 +394,28 @@ class RobotClient:
             list: [SeverityLevel (int), FailedDevices (list<str>)]
             Severity: 0=Negligible, 1=Serious, 2=Critical
         """
+        fallback = None
         try:
+            # Once the native call is known to return None, start the fallback
+            # read first so both requests are in flight together
+            if self._diag_needs_fallback:
+                fallback = self._get_status_pool().submit(self.get_joint_temperatures)
+            
             # ALBodyTemperature.getTemperatureDiagnosis returns [int, [str, str, ...]]
             result = self.client.ALBodyTemperature.getTemperatureDiagnosis()
             
             if result is not None:
+                self._diag_needs_fallback = False
+                if fallback is not None:
+                    fallback.cancel()
                 return result
             
             # FALLBACK: Native diagnosis failed (None). Try manual ALMemory check.
             if self.verbose:
                 print("Native diagnosis returned None. Falling back to ALMemory sensors.")
             
-            temps = self.get_joint_temperatures()
+            self._diag_needs_fallback = True
+            temps = fallback.result() if fallback is not None else self.get_joint_temperatures()
             if not temps:
                 return [2, ["SensorDataMissing"]]
             
@@ -0,0 +1,65 @@
+import heapq
+import itertools
+import threading
+import time
+from .logger import get_logger
+
+class PollScheduler:
+    """
+    Runs periodic background polls on one shared daemon thread.
+
+    Tasks sit in a min-heap keyed by their next due time (monotonic clock),
+    so the thread sleeps until the earliest deadline regardless of how many
+    pollers are registered. A task may return a number to override its next
+    interval (e.g. to back off when nothing changed); any other return value
+    keeps the interval it was registered with.
+    """
+    def __init__(self, name="PollScheduler"):
+        self.name = name
+        self._heap = []
+        self._seq = itertools.count()  # tie-breaker so tasks are never compared
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.logger = get_logger("PollScheduler")
+
+    def add(self, interval, fn, delay=0.0):
+        """Registers fn to run every `interval` seconds, first after `delay`."""
+        with self._lock:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), interval, fn))
+        self._wake.set()
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stops the thread after the task currently running (if any) returns."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+            if timeout is None or timeout > 0:
+                # Sleep until the earliest deadline, or until add()/stop() wakes us
+                self._wake.wait(timeout)
+                self._wake.clear()
+                continue
+
+            with self._lock:
+                _, seq, interval, fn = heapq.heappop(self._heap)
+            next_interval = interval
+            try:
+                result = fn()
+                if isinstance(result, (int, float)) and not isinstance(result, bool):
+                    next_interval = result
+            except Exception as e:
+                self.logger.error("PollTaskFailed", {"task": getattr(fn, "__name__", repr(fn)), "error": str(e)})
+            with self._lock:
+                heapq.heappush(self._heap, (time.monotonic() + next_interval, seq, interval, fn))
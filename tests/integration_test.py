@@ -15,7 +15,7 @@ def verify_full_stack_logging():
     
     # 1. Setup Logging
     print(f"--- Setting up logging to {log_file} ---")
-    setup_logging(log_file=log_file, verbose=True)
+    log_listener = setup_logging(log_file=log_file, verbose=True)
     logger = get_logger("IntegrationTest")
     
     # 2. Connect to Robot
@@ -67,6 +67,7 @@ def verify_full_stack_logging():
     # Action: Rest
     print("Action: Rest")
     client.rest()
+    log_listener.stop()  # flush queued records to disk
     
     # 4. Verify Log Content
     print(f"--- Verifying Log File: {log_file} ---")
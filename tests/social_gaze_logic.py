@@ -73,5 +73,18 @@ class TestPerceptionInterpreter(unittest.TestCase):
         self.assertEqual(center.x, 160)
         self.assertEqual(center.y, 48)
 
+    def test_mediapipe_row_landmarks(self):
+        """Verify that array-style (x, y, visibility) landmark rows are accepted."""
+        raw_data = {
+            "pose_landmarks": [(0.5, 0.2, 1.0)],
+            "detections": []
+        }
+        detection = self.interpreter.interpret(raw_data, "person", time.time())
+
+        self.assertIsNotNone(detection)
+        center = detection.bbox.center
+        self.assertEqual(center.x, 160)
+        self.assertEqual(center.y, 48)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+"""Unit tests for ExternalTracker's projection math."""
+import importlib.util
+import sys
+import types
+import unittest
+
+import numpy as np
+
+if "naoqi_proxy" not in sys.modules and importlib.util.find_spec("naoqi_proxy") is None:
+    # The proxy client ships with the PepperBox image; the tracker only needs
+    # the names to import, since the test hands it a fake robot client.
+    _stub = types.ModuleType("naoqi_proxy")
+    _stub.NaoqiClient = object
+    _stub.NaoqiProxyError = type("NaoqiProxyError", (Exception,), {})
+    sys.modules["naoqi_proxy"] = _stub
+
+from pepper_wizard.perception.external_tracker import ExternalTracker
+
+
+class _FakeTracker:
+    def __init__(self):
+        self.posted = []
+
+    def post(self, method, *args):
+        self.posted.append((method, args))
+
+    def stopTracker(self):
+        pass
+
+    def unregisterAllTargets(self):
+        pass
+
+
+class _FakeRobotClient:
+    def __init__(self):
+        self.client = types.SimpleNamespace(ALTracker=_FakeTracker())
+
+
+class ProjectBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.robot = _FakeRobotClient()
+        self.tracker = ExternalTracker(self.robot, target_distance=1.5)
+
+    def test_matches_scalar_look_at(self):
+        rng = np.random.default_rng(3)
+        corners = rng.uniform(0.0, 1.0, size=(12, 2, 2))
+        bboxes = np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1)  # [x1, y1, x2, y2]
+        ref_yaw, ref_pitch = 0.3, -0.1
+
+        points = self.tracker.project_batch(bboxes, ref_yaw, ref_pitch)
+        self.assertEqual(points.shape, (len(bboxes), 3))
+
+        for i, bbox in enumerate(bboxes):
+            self.tracker.look_at(list(bbox), reference_angles=(ref_yaw, ref_pitch),
+                                 deadzone_yaw=0.0, deadzone_pitch=0.0)
+            method, args = self.robot.client.ALTracker.posted[-1]
+            self.assertEqual(method, "lookAt")
+            np.testing.assert_allclose(points[i], args[0], rtol=1e-12, atol=1e-12)
+
+    def test_single_box_list_is_accepted(self):
+        points = self.tracker.project_batch([0.4, 0.4, 0.6, 0.6], 0.0, 0.0)
+        np.testing.assert_allclose(points, [[1.5, 0.0, ExternalTracker.HEAD_HEIGHT]], atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
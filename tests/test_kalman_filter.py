@@ -0,0 +1,60 @@
+"""Unit tests for the unrolled constant-velocity KalmanFilter."""
+import random
+import unittest
+
+import numpy as np
+
+from pepper_wizard.core.control.filters import KalmanFilter
+
+
+class _MatrixKalman:
+    """Textbook 4-state matrix implementation used as the reference."""
+
+    def __init__(self, q, r):
+        self.x = np.zeros((4, 1))
+        self.P = np.eye(4) * 10.0
+        self.H = np.array([[1, 0, 0, 0], [0, 1, 0, 0]])
+        self.Q = np.eye(4) * q
+        self.R = np.eye(2) * r
+
+    def predict(self, dt):
+        F = np.array([[1, 0, dt, 0], [0, 1, 0, dt], [0, 0, 1, 0], [0, 0, 0, 1]])
+        self.x = F @ self.x
+        self.P = F @ self.P @ F.T + self.Q
+        return self.x[0, 0], self.x[1, 0]
+
+    def update(self, measurement):
+        z = np.array(measurement).reshape((2, 1))
+        y = z - (self.H @ self.x)
+        S = self.H @ self.P @ self.H.T + self.R
+        K = self.P @ self.H.T @ np.linalg.inv(S)
+        self.x = self.x + (K @ y)
+        self.P = (np.eye(4) - (K @ self.H)) @ self.P
+        return self.x[0, 0], self.x[1, 0]
+
+
+class KalmanFilterTests(unittest.TestCase):
+    def test_matches_matrix_reference(self):
+        kf = KalmanFilter(process_noise=0.1, measurement_noise=150.0)
+        ref = _MatrixKalman(0.1, 150.0)
+        rng = random.Random(1)
+        for _ in range(300):
+            dt = rng.uniform(0.001, 0.15)
+            np.testing.assert_allclose(kf.predict(dt), ref.predict(dt), rtol=1e-9, atol=1e-9)
+            if rng.random() < 0.6:
+                z = [rng.uniform(0, 320), rng.uniform(0, 240)]
+                np.testing.assert_allclose(kf.update(z), ref.update(z), rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(kf.x, ref.x, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(kf.P, ref.P, rtol=1e-7, atol=1e-7)
+
+    def test_reset_restores_initial_uncertainty(self):
+        kf = KalmanFilter()
+        kf.predict(0.1)
+        kf.update([10.0, 20.0])
+        kf.reset()
+        np.testing.assert_array_equal(kf.x, np.zeros((4, 1)))
+        np.testing.assert_array_equal(kf.P, np.eye(4) * 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Unit tests for the JSONL log formatter."""
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from pepper_wizard.logger import (BufferedJSONFileHandler, JSONFormatter, RateLimitedLogger,
+                                  setup_logging, get_logger)
+
+
+class JSONFormatterTests(unittest.TestCase):
+    def _record(self, msg, args, created=1700000000.25):
+        record = logging.LogRecord("Main", logging.INFO, __file__, 1, msg, None, None)
+        record.args = args
+        record.created = created
+        return record
+
+    def test_emits_event_and_data(self):
+        line = JSONFormatter().format(self._record("MoveCommand", {"x": 0.2, "text": "héllo"}))
+        parsed = json.loads(line)
+        self.assertEqual(parsed["event"], "MoveCommand")
+        self.assertEqual(parsed["component"], "Main")
+        self.assertEqual(parsed["level"], "INFO")
+        self.assertEqual(parsed["data"], {"x": 0.2, "text": "héllo"})
+
+    def test_non_dict_args_give_empty_data(self):
+        parsed = json.loads(JSONFormatter().format(self._record("Started", ())))
+        self.assertEqual(parsed["data"], {})
+
+    def test_timestamp_prefix_follows_the_second(self):
+        formatter = JSONFormatter()
+        first = json.loads(formatter.format(self._record("Tick", (), created=1700000000.5)))
+        second = json.loads(formatter.format(self._record("Tick", (), created=1700000001.5)))
+        self.assertNotEqual(first["timestamp"][:19], second["timestamp"][:19])
+        self.assertTrue(second["timestamp"].endswith(".500000"))
+
+    def test_timestamp_has_microsecond_precision(self):
+        parsed = json.loads(JSONFormatter().format(self._record("Tick", ())))
+        self.assertTrue(parsed["timestamp"].endswith(".250000"))
+        self.assertEqual(parsed["timestamp"][10], "T")
+
+
+class SetupLoggingTests(unittest.TestCase):
+    def setUp(self):
+        self._root_handlers = logging.getLogger().handlers[:]
+        self._root_level = logging.getLogger().level
+
+    def tearDown(self):
+        root = logging.getLogger()
+        root.handlers = self._root_handlers
+        root.setLevel(self._root_level)
+
+    def test_queued_records_keep_payload(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = os.path.join(tmp, "session.jsonl")
+            listener = setup_logging(log_file=log_file)
+            get_logger("Teleop").info("MoveCommand", {"x": 0.5})
+            listener.stop()
+            with open(log_file, encoding="utf-8") as f:
+                events = [json.loads(line) for line in f]
+        self.assertEqual([e["event"] for e in events], ["LoggingInitialized", "MoveCommand"])
+        self.assertEqual(events[1]["data"], {"x": 0.5})
+
+    def test_buffered_handler_flushes_on_warning(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = os.path.join(tmp, "session.jsonl")
+            handler = BufferedJSONFileHandler(log_file)
+            handler.setFormatter(JSONFormatter())
+            self.assertFalse(os.path.exists(log_file))  # opened lazily
+            handler.handle(logging.makeLogRecord({"msg": "MoveCommand", "levelno": logging.INFO}))
+            with open(log_file, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "")
+            handler.handle(logging.makeLogRecord({"msg": "WatchdogStop", "levelno": logging.WARNING}))
+            with open(log_file, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 2)
+            handler.close()
+
+
+class _FormattingHandler(logging.Handler):
+    """Formats each record with the console and JSONL formatters, so a bad
+    record raises in the test instead of being swallowed by handleError."""
+
+    def __init__(self):
+        super().__init__()
+        self.console = logging.Formatter('[%(levelname)s] [%(name)s] %(message)s')
+        self.json = JSONFormatter()
+        self.lines = []
+        self.events = []
+
+    def emit(self, record):
+        self.lines.append(self.console.format(record))
+        self.events.append(json.loads(self.json.format(record)))
+
+
+class RateLimitedLoggerTests(unittest.TestCase):
+    def setUp(self):
+        self.handler = _FormattingHandler()
+        self.logger = logging.getLogger("RateLimitedLoggerTests")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def test_repeats_are_dropped_within_interval(self):
+        limited = RateLimitedLogger(self.logger, interval=60.0)
+        limited.warning("TuningLoadFailed", {"error": "a"})
+        limited.warning("TuningLoadFailed", {"error": "b"})
+        limited.warning("LookAtFailed")
+        self.assertEqual([(e["event"], e["data"]) for e in self.handler.events],
+                         [("TuningLoadFailed", {"error": "a"}), ("LookAtFailed", {})])
+
+    def test_event_is_emitted_again_after_interval(self):
+        limited = RateLimitedLogger(self.logger, interval=0.0)
+        limited.warning("TuningLoadFailed")
+        limited.warning("TuningLoadFailed")
+        self.assertEqual(len(self.handler.events), 2)
+
+    def test_events_without_payload_format_on_the_console(self):
+        limited = RateLimitedLogger(self.logger, interval=0.0)
+        limited.info("TrackerReady")
+        limited.warning("MissingReferenceAngles")
+        limited.error("LookAtFailed", {})
+        self.assertEqual(self.handler.lines, [
+            "[INFO] [RateLimitedLoggerTests] TrackerReady",
+            "[WARNING] [RateLimitedLoggerTests] MissingReferenceAngles",
+            "[ERROR] [RateLimitedLoggerTests] LookAtFailed",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Unit tests for the slotted core model dataclasses."""
+import copy
+import dataclasses
+import pickle
+import unittest
+
+from pepper_wizard.core.models import BBox, ControlCommand, Detection, Point
+
+
+class SlottedModelTests(unittest.TestCase):
+    def _models(self):
+        bbox = BBox(10.0, 20.0, 110.0, 220.0)
+        return [
+            Point(1.5, 2.5),
+            bbox,
+            Detection("person", 0.9, bbox, 123.0, source_yaw=0.1, source_pitch=-0.2),
+            ControlCommand("velocity", 0.1, -0.05, None, {"err_x": 0.3}),
+        ]
+
+    def test_copy_deepcopy_and_pickle_round_trip(self):
+        for model in self._models():
+            for name, clone in (("copy", copy.copy),
+                                ("deepcopy", copy.deepcopy),
+                                ("pickle", lambda o: pickle.loads(pickle.dumps(o)))):
+                with self.subTest(model=type(model).__name__, via=name):
+                    result = clone(model)
+                    self.assertIs(type(result), type(model))
+                    self.assertEqual(result, model)
+
+    def test_bbox_center_survives_round_trip(self):
+        bbox = pickle.loads(pickle.dumps(BBox(0.0, 0.0, 4.0, 2.0)))
+        self.assertEqual(bbox.center, Point(2.0, 1.0))
+
+    def test_models_stay_frozen_and_dictless(self):
+        for model in self._models():
+            with self.subTest(model=type(model).__name__):
+                self.assertFalse(hasattr(model, "__dict__"))
+                with self.assertRaises(dataclasses.FrozenInstanceError):
+                    setattr(model, dataclasses.fields(model)[0].name, None)
+                with self.assertRaises(dataclasses.FrozenInstanceError):
+                    model.extra = 1
+                with self.assertRaises(dataclasses.FrozenInstanceError):
+                    delattr(model, dataclasses.fields(model)[0].name)
+
+    def test_cached_center_is_not_a_field(self):
+        bbox = BBox(0.0, 0.0, 2.0, 2.0)
+        self.assertEqual([f.name for f in dataclasses.fields(bbox)], ["xmin", "ymin", "xmax", "ymax"])
+        self.assertEqual(dataclasses.asdict(bbox), {"xmin": 0.0, "ymin": 0.0, "xmax": 2.0, "ymax": 2.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Unit tests for PerceptionClient against a plain REP service."""
+import json
+import threading
+import time
+import unittest
+
+import numpy as np
+import zmq
+
+from pepper_wizard.perception.perception_client import PerceptionClient
+
+
+class PerceptionClientTests(unittest.TestCase):
+    def setUp(self):
+        self.context = zmq.Context()
+        self.server = self.context.socket(zmq.REP)
+        port = self.server.bind_to_random_port("tcp://127.0.0.1")
+        self.delays = []
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+        self.client = PerceptionClient(f"tcp://127.0.0.1:{port}")
+        self.img = np.zeros((24, 32, 3), dtype=np.uint8)
+
+    def tearDown(self):
+        self.client.close()
+        self.stop.set()
+        self.thread.join(2.0)
+        self.context.term()
+
+    def _serve(self):
+        n = 0
+        while not self.stop.is_set():
+            if not self.server.poll(50):
+                continue
+            meta, _img = self.server.recv_multipart()
+            n += 1
+            if self.delays:
+                time.sleep(self.delays.pop(0))
+            self.server.send_json({"data": {"n": n, "meta": json.loads(meta)}})
+        self.server.close(linger=0)
+
+    def test_round_trip_with_rep_server(self):
+        data = self.client.detect(self.img, target_label="person")
+        self.assertEqual(data, {"n": 1, "meta": {"target": "person"}})
+
+    def test_late_reply_is_discarded_without_reconnecting(self):
+        socket = self.client.socket
+        self.delays = [1.3]
+        self.assertIsNone(self.client.detect(self.img))
+        # The reply to request 1 arrives during this call and must be skipped
+        data = self.client.detect(self.img)
+        self.assertEqual(data["n"], 2)
+        self.assertIs(self.client.socket, socket)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Unit tests for the specialized PIDController update path."""
+import itertools
+import random
+import unittest
+
+from pepper_wizard.core.control.pid import PIDController
+
+
+class PIDSpecializationTests(unittest.TestCase):
+    def _run_pair(self, **kwargs):
+        specialized = PIDController(**kwargs)
+        reference = PIDController(**kwargs)
+        rng = random.Random(0)
+        for _ in range(200):
+            error = rng.uniform(-1.0, 1.0)
+            dt = rng.choice([0.00005, 0.01, 0.02])
+            got = specialized.update(error, dt)
+            want = PIDController.update(reference, error, dt)
+            self.assertAlmostEqual(got, want, places=12)
+        self.assertAlmostEqual(specialized.last_output, reference.last_output, places=12)
+
+    def test_matches_generic_update_for_every_feature_combination(self):
+        for deadzone, ki, max_output, max_acc, smoothing in itertools.product(
+            [0.0, 0.1], [0.0, 0.015], [None, 0.2], [None, 1.0], [0.0, 0.3]
+        ):
+            with self.subTest(deadzone=deadzone, ki=ki, max_output=max_output,
+                              max_acceleration=max_acc, output_smoothing=smoothing):
+                self._run_pair(kp=0.05, kd=0.03, ki=ki, deadzone=deadzone,
+                               max_output=max_output, max_acceleration=max_acc,
+                               output_smoothing=smoothing)
+
+    def test_runtime_kp_change_is_honoured(self):
+        pid = PIDController(kp=0.1)
+        pid.kp = 1.0
+        self.assertAlmostEqual(pid.update(0.5, 0.01), 0.5)
+
+    def test_reset_clears_state(self):
+        pid = PIDController(kp=0.1, ki=0.5)
+        pid.update(0.5, 0.01)
+        pid.reset()
+        self.assertEqual(pid.last_output, 0.0)
+        self.assertEqual(pid.integral, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Unit tests for RobotClient against a fake NaoqiClient."""
+import importlib.util
+import sys
+import threading
+import types
+import unittest
+from unittest import mock
+
+if "naoqi_proxy" not in sys.modules and importlib.util.find_spec("naoqi_proxy") is None:
+    # The proxy client ships with the PepperBox image; these tests replace
+    # NaoqiClient with a fake, so only the names need to import.
+    _stub = types.ModuleType("naoqi_proxy")
+    _stub.NaoqiClient = object
+    _stub.NaoqiProxyError = type("NaoqiProxyError", (Exception,), {})
+    sys.modules["naoqi_proxy"] = _stub
+
+from pepper_wizard import robot_client as robot_client_module
+from pepper_wizard.robot_client import RobotClient
+
+
+class _FakeModule:
+    """Records calls; methods in `impl` override the default None result."""
+
+    def __init__(self, name, calls, impl):
+        self._name = name
+        self._calls = calls
+        self._impl = impl
+
+    def __getattr__(self, method):
+        def call(*args):
+            self._calls.append((self._name, method, args))
+            fn = self._impl.get(method)
+            return fn(*args) if fn else None
+        return call
+
+
+class _FakeNaoqiClient:
+    def __init__(self, host=None, port=None):
+        self.calls = []
+        self.impl = {}
+
+    def __getattr__(self, module):
+        return _FakeModule(module, self.calls, self.impl.setdefault(module, {}))
+
+
+class _RobotClientTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(robot_client_module, "NaoqiClient", _FakeNaoqiClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.robot = RobotClient("fake-host", 0)
+        self.fake = self.robot.client
+
+    def count(self, module, method):
+        return sum(1 for m, name, _ in self.fake.calls if (m, name) == (module, method))
+
+
+class StateCacheTests(_RobotClientTestCase):
+    def test_repeated_reads_are_served_from_cache(self):
+        self.fake.impl["ALBasicAwareness"] = {"isEnabled": lambda: True}
+        self.assertTrue(self.robot.get_social_state())
+        self.assertTrue(self.robot.get_social_state())
+        self.assertEqual(self.count("ALBasicAwareness", "isEnabled"), 1)
+
+    def test_read_during_setter_rpc_is_not_cached(self):
+        state = {"enabled": False}
+
+        def set_enabled(value):
+            # A getter running while the setter RPC is in flight sees the old value
+            self.assertFalse(self.robot.get_social_state())
+            state["enabled"] = value
+
+        self.fake.impl["ALBasicAwareness"] = {
+            "isEnabled": lambda: state["enabled"],
+            "setEnabled": set_enabled,
+        }
+        self.assertFalse(self.robot.get_social_state())
+        self.robot.set_social_state(True)
+        self.assertTrue(self.robot.get_social_state())
+
+
+class AsyncSpeechTests(_RobotClientTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(self.robot.close)
+        self.spoken = []
+        self.threads = set()
+
+        def say(text):
+            self.threads.add(threading.current_thread().name)
+            self.spoken.append(text)
+
+        self.fake.impl["ALTextToSpeech"] = {"say": say}
+        self.fake.impl["ALAnimatedSpeech"] = {"say": say}
+        self.fake.impl["ALAnimationPlayer"] = {"runTag": lambda tag: say(f"[{tag}]")}
+
+    def test_calls_run_in_submission_order_on_one_worker(self):
+        self.robot.talk_async("one")
+        self.robot.animated_talk_async("happy", "two")
+        self.robot.play_animation_async("wave")
+        self.robot.talk_async("three").result(timeout=1.0)
+        self.assertEqual(self.spoken, ["one", "^startTag(happy) two ^stopTag(happy)", "[wave]", "three"])
+        self.assertEqual(len(self.threads), 1)
+        self.assertNotIn(threading.current_thread().name, self.threads)
+
+    def test_is_speaking_tracks_the_latest_submission(self):
+        self.assertFalse(self.robot.is_speaking())
+        release = threading.Event()
+        self.fake.impl["ALTextToSpeech"]["say"] = lambda text: release.wait(1.0)
+        future = self.robot.talk_async("long sentence")
+        self.assertTrue(self.robot.is_speaking())
+        release.set()
+        future.result(timeout=1.0)
+        self.assertFalse(self.robot.is_speaking())
+
+    def test_close_finishes_current_call_and_cancels_queued_ones(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_say(text):
+            started.set()
+            release.wait(1.0)
+            self.spoken.append(text)
+
+        self.fake.impl["ALTextToSpeech"]["say"] = slow_say
+        current = self.robot.talk_async("current")
+        queued = self.robot.talk_async("queued")
+        self.assertTrue(started.wait(1.0))
+        threading.Timer(0.05, release.set).start()
+        self.robot.close()
+        self.assertTrue(current.done())
+        self.assertTrue(queued.cancelled())
+        self.assertEqual(self.spoken, ["current"])
+        with self.assertRaises(RuntimeError):
+            self.robot.talk_async("after close")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Unit tests for the shared-thread PollScheduler."""
+import threading
+import time
+import unittest
+
+from pepper_wizard.scheduling import PollScheduler
+
+
+class PollSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = PollScheduler()
+
+    def tearDown(self):
+        self.scheduler.stop(timeout=1.0)
+
+    def test_runs_tasks_in_deadline_order_on_one_thread(self):
+        calls = []
+        done = threading.Event()
+
+        def task(name):
+            def fn():
+                calls.append((name, threading.current_thread().name))
+                if len(calls) >= 4:
+                    done.set()
+            fn.__name__ = name
+            return fn
+
+        self.scheduler.add(0.05, task("slow"), delay=0.03)
+        self.scheduler.add(0.05, task("fast"))
+        self.scheduler.start()
+        self.assertTrue(done.wait(1.0))
+        self.assertEqual([name for name, _ in calls[:2]], ["fast", "slow"])
+        self.assertEqual({thread for _, thread in calls}, {"PollScheduler"})
+
+    def test_return_value_overrides_next_interval(self):
+        stamps = []
+        done = threading.Event()
+
+        def backoff():
+            stamps.append(time.monotonic())
+            if len(stamps) == 2:
+                done.set()
+            return 0.2
+
+        self.scheduler.add(0.01, backoff)
+        self.scheduler.start()
+        self.assertTrue(done.wait(1.0))
+        self.assertGreaterEqual(stamps[1] - stamps[0], 0.19)
+
+    def test_failing_task_keeps_being_scheduled(self):
+        calls = []
+        done = threading.Event()
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 2:
+                done.set()
+            raise RuntimeError("proxy down")
+
+        self.scheduler.add(0.01, flaky)
+        self.scheduler.start()
+        self.assertTrue(done.wait(1.0))
+
+    def test_stop_wakes_idle_thread(self):
+        self.scheduler.add(60.0, lambda: None, delay=60.0)
+        self.scheduler.start()
+        start = time.monotonic()
+        self.scheduler.stop(timeout=1.0)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertFalse(self.scheduler._thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()